@@ -3,7 +3,7 @@ ArXiv 논문 크롤러
 ArXiv API를 사용한 논문 검색 및 다운로드
 """
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 import arxiv
 import asyncio
@@ -12,6 +12,9 @@ from .base import BaseCrawler
 
 logger = logging.getLogger(__name__)
 
+# 파일명에 사용할 수 없는 문자 치환 테이블
+_FILENAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
 
 class ArXivCrawler(BaseCrawler):
     """
@@ -67,11 +70,15 @@ class ArXivCrawler(BaseCrawler):
                 )
             )
 
+            # 결과 일괄 수집 후 중복 사전 필터링 (다운로드 전에 한 번에 제거)
+            papers = await loop.run_in_executor(None, lambda: list(self.client.results(search)))
+            papers = self._dedupe_papers(papers)
+
             # 결과 처리
             results = []
-            for paper in await loop.run_in_executor(None, lambda: list(self.client.results(search))):
+            for paper_id, paper in papers:
                 paper_data = {
-                    "id": paper.entry_id.split('/')[-1],
+                    "id": paper_id,
                     "title": paper.title,
                     "authors": [author.name for author in paper.authors],
                     "summary": paper.summary,
@@ -96,6 +103,34 @@ class ArXivCrawler(BaseCrawler):
             logger.error(f"❌ ArXiv 크롤링 실패: {e}")
             raise
 
+    @staticmethod
+    def _dedupe_papers(papers: List[arxiv.Result]) -> List[Tuple[str, arxiv.Result]]:
+        """
+        ID / 정규화된 제목 기준 중복 논문 제거
+
+        Args:
+            papers: ArXiv 검색 결과 목록
+
+        Returns:
+            (논문 ID, 논문 객체) 리스트 (중복 제거, 순서 유지)
+        """
+        seen_ids = set()
+        seen_titles = set()
+        unique = []
+
+        for paper in papers:
+            paper_id = paper.entry_id.rsplit('/', 1)[-1]
+            title_key = paper.title.strip().lower()
+            if paper_id in seen_ids or title_key in seen_titles:
+                continue
+            seen_ids.add(paper_id)
+            seen_titles.add(title_key)
+            unique.append((paper_id, paper))
+
+        if len(unique) < len(papers):
+            logger.info(f"🧹 중복 논문 제거: {len(papers)}개 → {len(unique)}개")
+        return unique
+
     def _build_query(self, categories: Optional[List[str]], keywords: Optional[List[str]]) -> str:
         """
         ArXiv 검색 쿼리 구성
@@ -143,21 +178,19 @@ class ArXivCrawler(BaseCrawler):
             pdf_dir = self.output_dir / "pdfs"
             pdf_dir.mkdir(parents=True, exist_ok=True)
 
-            pdf_path = pdf_dir / f"{paper_id}.pdf"
+            pdf_path = pdf_dir / f"{paper_id.translate(_FILENAME_TRANS)}.pdf"
 
             # 이미 다운로드된 경우 스킵
             if pdf_path.exists():
                 logger.debug(f"📄 PDF 이미 존재: {pdf_path}")
                 return pdf_path
 
-            # PDF 다운로드
+            # PDF 다운로드 (파일명을 직접 지정해 사후 rename 생략)
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, paper.download_pdf, str(pdf_dir))
-
-            # 파일명 변경 (ArXiv는 기본적으로 "arxiv_id.pdf"로 저장)
-            downloaded_file = pdf_dir / f"{paper_id.replace('.', '_')}.pdf"
-            if downloaded_file.exists():
-                downloaded_file.rename(pdf_path)
+            await loop.run_in_executor(
+                None,
+                lambda: paper.download_pdf(dirpath=str(pdf_dir), filename=pdf_path.name)
+            )
 
             logger.info(f"📥 PDF 다운로드 완료: {pdf_path}")
             return pdf_path
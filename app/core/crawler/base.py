@@ -5,7 +5,10 @@ Base Crawler Abstract Class
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from pathlib import Path
+from datetime import datetime
+import json
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +24,8 @@ class BaseCrawler(ABC):
         Args:
             output_dir: 크롤링 결과 저장 디렉토리
         """
+        # 디렉토리는 첫 저장 시점에 생성
         self.output_dir = Path(output_dir) if output_dir else None
-        if self.output_dir:
-            self.output_dir.mkdir(parents=True, exist_ok=True)
 
     @abstractmethod
     async def crawl(self, **kwargs) -> List[Dict[str, Any]]:
@@ -59,16 +61,19 @@ class BaseCrawler(ABC):
         if not self.output_dir:
             raise ValueError("output_dir가 설정되지 않았습니다.")
 
-        import json
-        from datetime import datetime
-
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"{self.get_source_name()}_{timestamp}.json"
 
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # 임시 파일에 한 번에 기록 후 교체 (중간 실패 시 기존 파일 보존)
         file_path = self.output_dir / filename
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
+        tmp_path = file_path.with_name(file_path.name + ".tmp")
+        payload = json.dumps(results, ensure_ascii=False, indent=2)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, file_path)
 
         logger.info(f"💾 크롤링 결과 저장: {file_path}")
         return file_path
@@ -7,6 +7,9 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# 단어 토큰 추출 패턴 (모듈 로드 시 한 번 컴파일)
+_WORD_PATTERN = re.compile(r'\b\w+\b')
+
 
 class KeywordFilter:
     """
@@ -38,12 +41,21 @@ class KeywordFilter:
         if fields is None:
             fields = ["title", "summary", "abstract", "content"]
 
+        # 소문자 변환 + 중복 제거는 한 번만 (순서 유지)
+        keyword_lower = tuple(dict.fromkeys(kw.lower() for kw in keywords))
+        # any 매칭은 대소문자 무시 alternation 정규식으로 텍스트를 한 번만 스캔
+        # (본문 lower() 변환 생략)
+        any_pattern = re.compile(
+            "|".join(re.escape(kw) for kw in keyword_lower),
+            re.IGNORECASE
+        )
+
         def matches(item: Dict[str, Any]) -> bool:
             # 검색할 텍스트 수집
             search_texts = []
             for field in fields:
                 if field in item and item[field]:
-                    search_texts.append(str(item[field]).lower())
+                    search_texts.append(str(item[field]))
 
             if not search_texts:
                 return False
@@ -51,11 +63,11 @@ class KeywordFilter:
             combined_text = " ".join(search_texts)
 
             # 키워드 매칭
-            keyword_lower = [kw.lower() for kw in keywords]
             if match_all:
-                return all(kw in combined_text for kw in keyword_lower)
+                combined_lower = combined_text.lower()
+                return all(kw in combined_lower for kw in keyword_lower)
             else:
-                return any(kw in combined_text for kw in keyword_lower)
+                return any_pattern.search(combined_text) is not None
 
         filtered = [item for item in items if matches(item)]
         logger.info(f"🔍 키워드 필터링: {len(items)}개 → {len(filtered)}개")
@@ -74,9 +86,9 @@ class KeywordFilter:
             추출된 키워드 리스트
         """
         # 간단한 키워드 추출 (실제로는 더 정교한 NLP 기법 사용 가능)
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = _WORD_PATTERN.findall(text.lower())
         # 길이 필터링 및 중복 제거
-        keywords = list(set([w for w in words if len(w) >= min_length]))
+        keywords = list({w for w in words if len(w) >= min_length})
         return keywords
 
     @staticmethod
@@ -96,19 +108,44 @@ class KeywordFilter:
         Returns:
             매칭 점수 (0.0 ~ 1.0)
         """
+        return KeywordFilter.score_batch([item], keywords, weights)[0]
+
+    @staticmethod
+    def score_batch(
+        items: List[Dict[str, Any]],
+        keywords: List[str],
+        weights: Optional[Dict[str, float]] = None
+    ) -> List[float]:
+        """
+        여러 아이템의 키워드 매칭 점수 일괄 계산
+        키워드 소문자 변환 및 가중치 합계는 한 번만 계산
+
+        Args:
+            items: 점수를 계산할 아이템 리스트
+            keywords: 검색 키워드
+            weights: 필드별 가중치 (기본값: title=2.0, summary=1.5, abstract=1.0)
+
+        Returns:
+            아이템별 매칭 점수 리스트 (0.0 ~ 1.0)
+        """
         if weights is None:
             weights = {"title": 2.0, "summary": 1.5, "abstract": 1.0, "content": 1.0}
 
-        total_score = 0.0
         total_weight = sum(weights.values())
-
         keyword_lower = [kw.lower() for kw in keywords]
-
-        for field, weight in weights.items():
-            if field in item and item[field]:
-                text = str(item[field]).lower()
-                matches = sum(1 for kw in keyword_lower if kw in text)
-                field_score = matches / len(keyword_lower) if keyword_lower else 0.0
-                total_score += field_score * weight
-
-        return total_score / total_weight if total_weight > 0 else 0.0
+        if total_weight <= 0 or not keyword_lower:
+            return [0.0] * len(items)
+
+        field_weights = [(field, weight / len(keyword_lower)) for field, weight in weights.items()]
+
+        scores = []
+        for item in items:
+            total_score = 0.0
+            for field, weight in field_weights:
+                value = item.get(field)
+                if value:
+                    text = str(value).lower()
+                    total_score += sum(1 for kw in keyword_lower if kw in text) * weight
+            scores.append(total_score / total_weight)
+
+        return scores
@@ -117,13 +117,16 @@ class MultiSourceCrawler:
                 logger.error(f"❌ {source} 크롤러 생성 실패: {e}")
                 results[source] = []
 
-        # 병렬 실행
-        for source, task in tasks:
-            try:
-                source_results = await task
-                results[source] = source_results
-            except Exception as e:
-                logger.error(f"❌ {source} 크롤링 실패: {e}")
+        # 병렬 실행 (코루틴을 동시에 스케줄링)
+        outcomes = await asyncio.gather(
+            *(task for _, task in tasks),
+            return_exceptions=True
+        )
+        for (source, _), outcome in zip(tasks, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"❌ {source} 크롤링 실패: {outcome}")
                 results[source] = []
+            else:
+                results[source] = outcome
 
         return results
@@ -4,52 +4,252 @@ FAISS 기반 Vector Database
 """
 import os
 import json
+import pickle
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+import threading
+import uuid
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple, Union
 from pathlib import Path
 
 import numpy as np
 import faiss
+import torch
 from sentence_transformers import SentenceTransformer
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_community.vectorstores import FAISS
-from langchain_community.docstore.in_memory import InMemoryDocstore
+from langchain_community.docstore.base import AddableMixin, Docstore
+
+from ..memory.conversation_simple import SimpleConversationMemory
 
 logger = logging.getLogger(__name__)
 
-# FAISS GPU 검사
-try:
-    GPU_AVAILABLE = hasattr(faiss, 'StandardGpuResources') and faiss.get_num_gpus() > 0
-    if GPU_AVAILABLE:
-        logger.info(f" FAISS GPU 사용 가능 ({faiss.get_num_gpus()}개 GPU 감지)")
+# 프로세스 전역 공유 리소스 (최초 사용 시 로드)
+_MODEL_CACHE: Dict[str, SentenceTransformer] = {}
+_GPU_RES: Optional["faiss.StandardGpuResources"] = None
+_RESOURCE_LOCK = threading.Lock()
+
+# 기본 임베딩 모델
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+# 이 크기 미만의 Flat 인덱스는 LangChain 래퍼 없이 행렬 직접 검색
+SMALL_CORPUS_THRESHOLD = 1024
+
+# 쿼리 임베딩 캐시 최대 항목 수
+QUERY_CACHE_SIZE = 4096
+
+# 문서 임베딩 배치 크기 범위 (입력 수에 맞춰 조정)
+MIN_ENCODE_BATCH_SIZE = 8
+MAX_ENCODE_BATCH_SIZE = 128
+
+# 알려진 임베딩 모델의 출력 차원 (차원 확인만을 위한 모델 로드 생략)
+_KNOWN_MODEL_DIMS: Dict[str, int] = {
+    "sentence-transformers/all-MiniLM-L6-v2": 384,
+    "sentence-transformers/all-MiniLM-L12-v2": 384,
+    "sentence-transformers/all-mpnet-base-v2": 768,
+    "BAAI/bge-small-en-v1.5": 384,
+    "BAAI/bge-base-en-v1.5": 768,
+    "BAAI/bge-large-en-v1.5": 1024,
+    "BAAI/bge-m3": 1024,
+}
+
+
+# IVF-PQ FastScan(4비트) PQ 세그먼트 수 (임베딩 차원의 약수여야 함, 아니면 8비트 IVFPQ 사용)
+FAST_SCAN_PQ_M = 16
+
+# GPU로 이동할 인덱스 타입 (HNSW 그래프 탐색 / IVF-PQ / SQ-fp16은 CPU에서 실행)
+GPU_INDEX_TYPES = frozenset({"flat"})
+
+# FAISS GPU 검사 결과 (import 시점이 아닌 최초 사용 시 1회 검사)
+_gpu_available: Optional[bool] = None
+
+
+def _is_gpu_available() -> bool:
+    """FAISS GPU 사용 가능 여부 (CUDA 초기화는 최초 호출 시에만 수행)"""
+    global _gpu_available
+    if _gpu_available is None:
+        try:
+            num_gpus = faiss.get_num_gpus() if hasattr(faiss, 'StandardGpuResources') else 0
+            _gpu_available = num_gpus > 0
+            if _gpu_available:
+                logger.info(f" FAISS GPU 사용 가능 ({num_gpus}개 GPU 감지)")
+            else:
+                logger.info(" FAISS CPU 모드")
+        except Exception as e:
+            _gpu_available = False
+            logger.warning(f" FAISS GPU 체크 실패, CPU 모드로 실행: {e}")
+    return _gpu_available
+
+
+@lru_cache(maxsize=1)
+def _log_simd_support() -> None:
+    """FAISS CPU 빌드의 SIMD 지원 확인 (최초 1회, AVX2 미만 빌드면 경고)"""
+    get_instruction_sets = getattr(faiss, "supported_instruction_sets", None)
+    if get_instruction_sets is None:
+        return
+    try:
+        instruction_sets = get_instruction_sets()
+    except Exception as e:
+        logger.debug("SIMD 지원 확인 실패: %s", e)
+        return
+
+    if "AVX2" in instruction_sets or "AVX512" in instruction_sets or "NEON" in instruction_sets:
+        logger.info(f"⚡ FAISS CPU SIMD 지원: {', '.join(sorted(instruction_sets))}")
     else:
-        logger.info(" FAISS CPU 모드")
-except Exception as e:
-    GPU_AVAILABLE = False
-    logger.warning(f" FAISS GPU 체크 실패, CPU 모드로 실행: {e}")
+        logger.warning("⚠️ FAISS CPU 빌드에서 AVX2/AVX512 SIMD를 감지하지 못함 (벡터 검색 성능 저하 가능)")
+
+
+def _get_sentence_transformer(model_name: str) -> SentenceTransformer:
+    """모델명 기준으로 SentenceTransformer를 한 번만 로드해 공유"""
+    model = _MODEL_CACHE.get(model_name)
+    if model is None:
+        with _RESOURCE_LOCK:
+            model = _MODEL_CACHE.get(model_name)
+            if model is None:
+                logger.info(f"📦 임베딩 모델 로드: {model_name}")
+                model = SentenceTransformer(model_name)
+                _MODEL_CACHE[model_name] = model
+    return model
+
+
+def _get_gpu_resources() -> "faiss.StandardGpuResources":
+    """FAISS GPU 리소스를 한 번만 할당해 공유"""
+    global _GPU_RES
+    if _GPU_RES is None:
+        with _RESOURCE_LOCK:
+            if _GPU_RES is None:
+                _GPU_RES = faiss.StandardGpuResources()
+                logger.info("🚀 FAISS GPU 리소스 초기화 완료")
+    return _GPU_RES
 
-from ..memory.conversation_simple import SimpleConversationMemory
 
-logger = logging.getLogger(__name__)
+def _encode_texts(model: SentenceTransformer, texts: List[str], **kwargs) -> np.ndarray:
+    """
+    문서 임베딩 일괄 계산
+    autograd 기록 없이(inference_mode) 입력 수에 맞춘 배치 크기로 인코딩
+    """
+    batch_size = min(MAX_ENCODE_BATCH_SIZE, max(MIN_ENCODE_BATCH_SIZE, len(texts)))
+    with torch.inference_mode():
+        return model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False,
+            **kwargs
+        )
 
 
-class SentenceTransformerEmbeddings:
-    """LangChain 호환 SentenceTransformer 임베딩 래퍼"""
+class SentenceTransformerEmbeddings(Embeddings):
+    """LangChain 호환 SentenceTransformer 임베딩 래퍼 (L2 정규화 임베딩 반환, 내적 인덱스 = 코사인 유사도)"""
 
     def __init__(self, model):
         self.model = model
-
-    def __call__(self, texts: List[str]) -> List[List[float]]:
-        """FAISS 호환 호출 메소드"""
+        # 쿼리 텍스트 -> 임베딩 (LRU, 반복 질의 재인코딩 방지, 읽기 전용 float32 배열로 보관)
+        self._query_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+
+    def __call__(self, texts: Union[str, List[str]]) -> Union[List[float], List[List[float]]]:
+        """FAISS 호환 호출 메소드 (단일 문자열은 쿼리 임베딩 하나를 반환)"""
+        if isinstance(texts, str):
+            return self.embed_query(texts)
         return self.embed_documents(texts)
 
     def embed_query(self, text: str) -> List[float]:
-        """단일 텍스트 임베딩"""
-        return self.model.encode(text).tolist()
+        """단일 텍스트 임베딩 (LangChain 호환 리스트 반환)"""
+        return self.embed_query_array(text).tolist()
+
+    def embed_query_array(self, text: str) -> np.ndarray:
+        """
+        단일 텍스트 임베딩 (float32 배열 그대로 반환, 동일 쿼리는 캐시에서 반환)
+        FAISS 직접 검색 시 Python float 리스트 변환 없이 사용
+        """
+        with self._query_cache_lock:
+            cached = self._query_cache.get(text)
+            if cached is not None:
+                self._query_cache.move_to_end(text)
+                return cached
+
+        vector = np.ascontiguousarray(
+            self.model.encode(text, convert_to_numpy=True, normalize_embeddings=True),
+            dtype=np.float32
+        )
+        vector.setflags(write=False)
+
+        with self._query_cache_lock:
+            self._query_cache[text] = vector
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+
+        return vector
 
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
-        """여러 텍스트 임베딩"""
-        return self.model.encode(texts).tolist()
+        """여러 텍스트 임베딩 (중복 텍스트는 한 번만 토큰화/인코딩)"""
+        unique_texts = list(dict.fromkeys(texts))
+        if len(unique_texts) == len(texts):
+            return _encode_texts(self.model, texts, normalize_embeddings=True).tolist()
+
+        vectors = _encode_texts(self.model, unique_texts, normalize_embeddings=True)
+        rows = {text: i for i, text in enumerate(unique_texts)}
+        return vectors[[rows[text] for text in texts]].tolist()
+
+
+class ColumnarDocstore(Docstore, AddableMixin):
+    """
+    컬럼 기반 문서 저장소 (InMemoryDocstore 대체)
+    - Document 객체 대신 content / metadata(dict 원본) 컬럼으로 보관
+    - 조회 시에만 Document 생성
+    - 삭제된 행은 다음 추가 시 재사용
+    """
+
+    def __init__(self):
+        self._rows: Dict[str, int] = {}
+        self._contents: List[Optional[str]] = []
+        self._metadatas: List[Optional[Dict[str, Any]]] = []
+        self._free_rows: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, texts: Dict[str, Document]) -> None:
+        """문서 추가 (id -> Document)"""
+        overlapping = self._rows.keys() & texts.keys()
+        if overlapping:
+            raise ValueError(f"이미 존재하는 문서 ID: {overlapping}")
+
+        for doc_id, doc in texts.items():
+            if self._free_rows:
+                row = self._free_rows.pop()
+                self._contents[row] = doc.page_content
+                self._metadatas[row] = doc.metadata
+            else:
+                row = len(self._contents)
+                self._contents.append(doc.page_content)
+                self._metadatas.append(doc.metadata)
+            self._rows[doc_id] = row
+
+    def delete(self, ids: List) -> None:
+        """문서 삭제 (ID 매핑 제거, 비운 행은 재사용 목록에 추가)"""
+        missing = [doc_id for doc_id in ids if doc_id not in self._rows]
+        if missing:
+            raise ValueError(f"존재하지 않는 문서 ID: {missing}")
+
+        for doc_id in ids:
+            row = self._rows.pop(doc_id)
+            self._contents[row] = None
+            self._metadatas[row] = None
+            self._free_rows.append(row)
+
+    def search(self, search: str) -> Union[str, Document]:
+        """문서 ID로 Document 조회 (메타데이터는 얕은 복사본으로 전달)"""
+        row = self._rows.get(search)
+        if row is None:
+            return f"ID {search} not found."
+        return Document(
+            page_content=self._contents[row],
+            metadata=dict(self._metadatas[row])
+        )
 
 
 class FAISSVectorDB:
@@ -62,44 +262,67 @@ class FAISSVectorDB:
 
     def __init__(
         self,
-        embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2", 
+        embedding_model: str = DEFAULT_EMBEDDING_MODEL,
         index_path: str = "app/data/vectorstore/faiss_index",
         persist_directory: str = "app/data/vectorstore",
-        index_type: str = "auto",  # "auto", "flat", "ivf_pq", "hnsw"
-        use_gpu: bool = True
+        index_type: str = "auto",  # "auto", "flat", "sq_fp16", "ivf_pq", "hnsw"
+        use_gpu: bool = True,
+        pq_fast_scan: bool = True  # IVF-PQ를 4비트 FastScan으로 생성 (False: 8비트 IVFPQ)
     ):
         self.embedding_model = embedding_model
         self.index_path = Path(index_path)
         self.persist_directory = Path(persist_directory)
         self.persist_directory.mkdir(parents=True, exist_ok=True)
         self.index_type = index_type
-        self.use_gpu = use_gpu and GPU_AVAILABLE
-
-        # Sentence Transformer 임베딩 모델 초기화
-        self.embeddings_model = SentenceTransformer(embedding_model)
-        self.embedding_dim = self.embeddings_model.get_sentence_embedding_dimension()
+        self.use_gpu = use_gpu and _is_gpu_available()
+        self.pq_fast_scan = pq_fast_scan
 
-        # LangChain 호환 임베딩 래퍼
-        self.embeddings = SentenceTransformerEmbeddings(self.embeddings_model)
+        # 임베딩 모델 / GPU 리소스는 최초 사용 시 로드 (프로세스 전역 공유)
+        self._embeddings: Optional[SentenceTransformerEmbeddings] = None
+        self._embedding_dim: Optional[int] = None
 
         # FAISS 벡터 스토어
         self.vectorstore: Optional[FAISS] = None
-
-        # GPU 리소스 (GPU 사용시)
-        self.gpu_resource = None
-        if self.use_gpu:
-            try:
-                self.gpu_resource = faiss.StandardGpuResources()
-                logger.info("🚀 FAISS GPU 리소스 초기화 완료")
-            except Exception as e:
-                logger.warning(f"⚠️ GPU 리소스 초기화 실패, CPU 모드로 전환: {e}")
-                self.use_gpu = False
+        self._index_mmapped = False  # 디스크 mmap 읽기 전용 인덱스 여부
 
         # 메타데이터 저장
         self.metadata_file = self.persist_directory / "metadata.json"
 
         logger.info(f"🎯 FAISS VectorDB 초기화: {embedding_model} ({'GPU' if self.use_gpu else 'CPU'} 모드, {self.index_type} 인덱스)")
 
+    @property
+    def embeddings_model(self) -> SentenceTransformer:
+        """Sentence Transformer 임베딩 모델 (지연 로드)"""
+        return _get_sentence_transformer(self.embedding_model)
+
+    @property
+    def embedding_dim(self) -> int:
+        """임베딩 차원 (알려진 모델은 모델을 로드하지 않고 조회)"""
+        if self._embedding_dim is None:
+            self._embedding_dim = _KNOWN_MODEL_DIMS.get(self.embedding_model)
+            if self._embedding_dim is None:
+                self._embedding_dim = self.embeddings_model.get_sentence_embedding_dimension()
+        return self._embedding_dim
+
+    @property
+    def embeddings(self) -> SentenceTransformerEmbeddings:
+        """LangChain 호환 임베딩 래퍼"""
+        if self._embeddings is None:
+            self._embeddings = SentenceTransformerEmbeddings(self.embeddings_model)
+        return self._embeddings
+
+    @property
+    def gpu_resource(self) -> Optional["faiss.StandardGpuResources"]:
+        """FAISS GPU 리소스 (GPU 사용시, 지연 할당)"""
+        if not self.use_gpu:
+            return None
+        try:
+            return _get_gpu_resources()
+        except Exception as e:
+            logger.warning(f"⚠️ GPU 리소스 초기화 실패, CPU 모드로 전환: {e}")
+            self.use_gpu = False
+            return None
+
     def initialize(self) -> bool:
         """벡터 데이터베이스 초기화"""
         try:
@@ -132,68 +355,129 @@ class FAISSVectorDB:
             index = faiss.IndexFlatIP(self.embedding_dim)
             logger.info("📍 Flat 인덱스 (정확한 검색, 빠른 소규모 DB)")
             
+        elif index_type == "sq_fp16":
+            # float16 스칼라 양자화 Flat 인덱스 (벡터 저장 용량 절반, 학습 불필요)
+            # 임베딩은 float32로 전달하고 인덱스 내부에서 float16으로 저장
+            index = faiss.IndexScalarQuantizer(
+                self.embedding_dim,
+                faiss.ScalarQuantizer.QT_fp16,
+                faiss.METRIC_INNER_PRODUCT
+            )
+            logger.info("🗜️ SQ-fp16 인덱스 (정확 검색, 메모리 절반)")
+
         elif index_type == "ivf_pq":
             # IVF-PQ 인덱스 (메모리 효율적, 대용량 DB용)
             nlist = min(100, max(4, int(np.sqrt(10000))))  # 클러스터 수 (최소 4, 최대 100)
-            m = 8        # PQ 세그먼트 수
-            nbits = 8    # 비트 수
             quantizer = faiss.IndexFlatIP(self.embedding_dim)
-            index = faiss.IndexIVFPQ(quantizer, self.embedding_dim, nlist, m, nbits)
+            if self.pq_fast_scan and self.embedding_dim % FAST_SCAN_PQ_M == 0:
+                # 4비트 PQ FastScan: 코드를 블록 단위로 패킹해 SIMD 레지스터 내 셔플로 거리 계산
+                # (8비트 LUT 조회 대신, 코드 크기는 8비트 x 8 세그먼트와 동일)
+                m = FAST_SCAN_PQ_M
+                index = faiss.IndexIVFPQFastScan(
+                    quantizer, self.embedding_dim, nlist, m, 4, faiss.METRIC_INNER_PRODUCT
+                )
+                logger.info(f"🗂️ IVF-PQ FastScan 인덱스 (메모리 효율, nlist={nlist}, m={m}, 4bit)")
+            else:
+                m = 8        # PQ 세그먼트 수
+                nbits = 8    # 비트 수
+                index = faiss.IndexIVFPQ(quantizer, self.embedding_dim, nlist, m, nbits)
+                logger.info(f"🗂️ IVF-PQ 인덱스 (메모리 효율, nlist={nlist})")
             # IVF 인덱스는 train이 필요하지만 빈 상태에서는 스킵
-            logger.info(f"🗂️ IVF-PQ 인덱스 (메모리 효율, nlist={nlist})")
             
         elif index_type == "hnsw":
             # HNSW 인덱스 (빠른 근사 검색)
+            # 정규화 임베딩의 내적(코사인) 거리 + float16 벡터 저장 (그래프 탐색 시 메모리 대역폭 절반)
             M = 32  # 연결 수
-            index = faiss.IndexHNSWFlat(self.embedding_dim, M)
+            index = faiss.index_factory(self.embedding_dim, f"HNSW{M},SQfp16", faiss.METRIC_INNER_PRODUCT)
             index.hnsw.efConstruction = 200  # 구축 시 탐색 깊이
             index.hnsw.efSearch = 100        # 검색 시 탐색 깊이
-            logger.info(f"🕸️ HNSW 인덱스 (빠른 근사 검색, M={M})")
+            logger.info(f"🕸️ HNSW-SQfp16 인덱스 (빠른 근사 검색, M={M})")
             
         else:
             # 기본값: Flat
             index = faiss.IndexFlatIP(self.embedding_dim)
             logger.info("📍 기본 Flat 인덱스")
 
-        # GPU 사용 시 GPU로 이동
-        if self.use_gpu and index_type != "ivf_pq":  # IVF-PQ는 GPU 지원 제한적
+        # GPU 사용 시 GPU로 이동 (GPU 이점이 있는 타입만, HNSW 등은 CPU SIMD 경로 사용)
+        on_gpu = False
+        if self.use_gpu and index_type in GPU_INDEX_TYPES and self.gpu_resource is not None:
             try:
                 gpu_index = faiss.index_cpu_to_gpu(self.gpu_resource, 0, index)
                 index = gpu_index
+                on_gpu = True
                 logger.info(f"🚀 {index_type.upper()} 인덱스 GPU로 이동 완료")
             except Exception as e:
                 logger.warning(f"⚠️ GPU 이동 실패, CPU에서 실행: {e}")
 
+        if not on_gpu:
+            _log_simd_support()
+
         # LangChain FAISS 래퍼로 생성
         self.vectorstore = FAISS(
             embedding_function=self.embeddings,
             index=index,
-            docstore=InMemoryDocstore(),
+            docstore=ColumnarDocstore(),
             index_to_docstore_id={}
         )
+        self._index_mmapped = False
 
-        logger.info(f"✅ {index_type.upper()} 인덱스 생성 완료 (차원: {self.embedding_dim}, {'GPU' if self.use_gpu and index_type != 'ivf_pq' else 'CPU'})")
+        logger.info(f"✅ {index_type.upper()} 인덱스 생성 완료 (차원: {self.embedding_dim}, {'GPU' if on_gpu else 'CPU'})")
+
+    @property
+    def _index_file(self) -> Path:
+        """FAISS 인덱스 파일 경로 (LangChain save_local 레이아웃)"""
+        return self.index_path / "index.faiss"
+
+    @property
+    def _docstore_file(self) -> Path:
+        """문서 저장소 pickle 경로 (LangChain save_local 레이아웃)"""
+        return self.index_path / "index.pkl"
 
     def _load_index(self) -> bool:
-        """기존 FAISS 인덱스 로드"""
+        """
+        기존 FAISS 인덱스 로드
+
+        인덱스 본체는 mmap 읽기 전용으로 열어 IVF 역색인 리스트를
+        첫 검색 시점에 OS 페이지 캐시로 읽어들이고, 문서 저장소만 메모리에 로드
+        """
         try:
-            if not self.index_path.exists():
+            if not self._index_file.exists() or not self._docstore_file.exists():
                 return False
 
-            self.vectorstore = FAISS.load_local(
-                str(self.index_path),
-                self.embeddings,
-                allow_dangerous_deserialization=True
+            index = faiss.read_index(
+                str(self._index_file),
+                faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
             )
+            with open(self._docstore_file, "rb") as f:
+                docstore, index_to_docstore_id = pickle.load(f)
+
+            self.vectorstore = FAISS(
+                embedding_function=self.embeddings,
+                index=index,
+                docstore=docstore,
+                index_to_docstore_id=index_to_docstore_id
+            )
+            self._index_mmapped = True
             return True
 
         except Exception as e:
             logger.warning(f"기존 인덱스 로드 실패: {e}")
             return False
 
+    def _ensure_writable_index(self):
+        """mmap 읽기 전용 인덱스를 쓰기 가능한 메모리 인덱스로 전환 (추가 직전 1회)"""
+        if not self._index_mmapped:
+            return
+        self.vectorstore.index = faiss.read_index(str(self._index_file))
+        self._index_mmapped = False
+        logger.info("📂 mmap 인덱스를 메모리로 로드 (쓰기 모드 전환)")
+
     def save_index(self):
         """FAISS 인덱스 저장"""
         try:
+            if self._index_mmapped:
+                # 변경 없음: mmap 원본 파일을 덮어쓰지 않음
+                return
             if self.vectorstore:
                 self.vectorstore.save_local(str(self.index_path))
                 logger.info(f"💾 FAISS 인덱스 저장: {self.index_path}")
@@ -207,6 +491,8 @@ class FAISSVectorDB:
                 logger.error("벡터 스토어가 초기화되지 않았습니다")
                 return False
 
+            self._ensure_writable_index()
+
             # 문서 추가
             self.vectorstore.add_documents(documents)
 
@@ -220,6 +506,47 @@ class FAISSVectorDB:
             logger.error(f"❌ 문서 추가 실패: {e}")
             return False
 
+    def add_documents_fast(self, documents: List[Document]) -> bool:
+        """
+        문서 추가 빠른 경로
+        임베딩을 float32 ndarray로 한 번에 계산해 FAISS 인덱스에 직접 추가
+        (LangChain 래퍼의 list-of-lists 변환 및 재복사 생략)
+        """
+        try:
+            if not self.vectorstore:
+                logger.error("벡터 스토어가 초기화되지 않았습니다")
+                return False
+
+            if not documents:
+                return True
+
+            self._ensure_writable_index()
+
+            # 임베딩 일괄 계산
+            texts = [doc.page_content for doc in documents]
+            # float32 C-연속 배열이면 복사 없이 그대로 사용
+            vectors = np.ascontiguousarray(
+                _encode_texts(self.embeddings_model, texts, normalize_embeddings=True),
+                dtype=np.float32
+            )
+
+            # 인덱스 / 문서 저장소 / ID 매핑 갱신
+            doc_ids = [str(uuid.uuid4()) for _ in documents]
+            start = self.vectorstore.index.ntotal
+            self.vectorstore.index.add(vectors)
+            self.vectorstore.docstore.add(dict(zip(doc_ids, documents)))
+            self.vectorstore.index_to_docstore_id.update(zip(range(start, start + len(doc_ids)), doc_ids))
+
+            # 인덱스 저장
+            self.save_index()
+
+            logger.info(f"✅ 문서 {len(documents)}개 추가 및 인덱싱 완료 (fast path)")
+            return True
+
+        except Exception as e:
+            logger.error(f"❌ 문서 추가 실패: {e}")
+            return False
+
     def add_texts(self, texts: List[str], metadatas: Optional[List[Dict[str, Any]]] = None):
         """텍스트 직접 추가"""
         try:
@@ -231,6 +558,8 @@ class FAISSVectorDB:
             if metadatas is None:
                 metadatas = [{"source": f"text_{i}", "chunk_id": i} for i in range(len(texts))]
 
+            self._ensure_writable_index()
+
             # 텍스트 추가
             self.vectorstore.add_texts(texts, metadatas=metadatas)
 
@@ -257,10 +586,12 @@ class FAISSVectorDB:
                 return []
 
             # 유사도 검색 (점수 포함)
-            docs_and_scores = self.vectorstore.similarity_search_with_score(
-                query,
-                k=k
-            )
+            docs_and_scores = self._small_corpus_search(query, k)
+            if docs_and_scores is None:
+                docs_and_scores = self.vectorstore.similarity_search_with_score(
+                    query,
+                    k=k
+                )
 
             # 점수 필터링
             filtered_results = [
@@ -275,6 +606,77 @@ class FAISSVectorDB:
             logger.error(f"❌ 유사도 검색 실패: {e}")
             return []
 
+    def _small_corpus_search(self, query: str, k: int) -> Optional[List[Tuple[Document, float]]]:
+        """
+        소규모 Flat 인덱스 직접 검색 (faiss.knn)
+        저장된 벡터 행렬을 복사 없이 참조해 한 번의 행렬곱으로 검색
+
+        Returns:
+            (문서, 점수) 리스트, 적용 대상이 아니면 None
+        """
+        index = self.vectorstore.index
+        if not isinstance(index, faiss.IndexFlat) or not 0 < index.ntotal < SMALL_CORPUS_THRESHOLD:
+            return None
+
+        xb = faiss.rev_swig_ptr(index.get_xb(), index.ntotal * index.d).reshape(index.ntotal, index.d)
+        xq = self.embeddings.embed_query_array(query).reshape(1, -1)
+        scores, ids = faiss.knn(xq, xb, min(k, index.ntotal), metric=index.metric_type)
+        return self._collect_results(scores[0], ids[0])
+
+    def _collect_results(self, scores: np.ndarray, ids: np.ndarray) -> List[Tuple[Document, float]]:
+        """FAISS 검색 결과 한 행(점수, 인덱스 ID)을 (문서, 점수) 리스트로 변환"""
+        docstore = self.vectorstore.docstore
+        index_to_docstore_id = self.vectorstore.index_to_docstore_id
+
+        results = []
+        for score, i in zip(scores, ids):
+            if i < 0:
+                continue
+            doc = docstore.search(index_to_docstore_id[i])
+            if isinstance(doc, Document):
+                results.append((doc, float(score)))
+        return results
+
+    def similarity_search_batch(
+        self,
+        queries: List[str],
+        k: int = 5,
+        score_threshold: float = 0.0
+    ) -> List[List[Tuple[Document, float]]]:
+        """
+        여러 쿼리 일괄 유사도 검색
+        쿼리 임베딩을 한 번에 계산하고 (쿼리 수, 차원) 행렬로 index.search를 1회 호출
+
+        Returns:
+            쿼리 순서대로 (문서, 점수) 리스트
+        """
+        try:
+            if not self.vectorstore:
+                logger.error("벡터 스토어가 초기화되지 않았습니다")
+                return [[] for _ in queries]
+
+            index = self.vectorstore.index
+            if not queries or index.ntotal == 0:
+                return [[] for _ in queries]
+
+            xq = np.ascontiguousarray(
+                _encode_texts(self.embeddings_model, queries, normalize_embeddings=True),
+                dtype=np.float32
+            )
+            scores, ids = index.search(xq, min(k, index.ntotal))
+
+            results = [
+                [(doc, score) for doc, score in self._collect_results(row_scores, row_ids) if score >= score_threshold]
+                for row_scores, row_ids in zip(scores, ids)
+            ]
+
+            logger.info(f"🔍 일괄 유사도 검색 완료: 쿼리 {len(queries)}개")
+            return results
+
+        except Exception as e:
+            logger.error(f"❌ 일괄 유사도 검색 실패: {e}")
+            return [[] for _ in queries]
+
     def get_stats(self) -> Dict[str, Any]:
         """벡터 DB 통계"""
         try:
@@ -286,7 +688,7 @@ class FAISSVectorDB:
                 "status": "initialized",
                 "embedding_model": self.embedding_model,
                 "index_path": str(self.index_path),
-                "total_documents": len(self.vectorstore.docstore._dict) if hasattr(self.vectorstore.docstore, '_dict') else 0
+                "total_documents": len(self.vectorstore.index_to_docstore_id)
             }
 
             return stats
@@ -345,7 +747,7 @@ def initialize_sample_data():
     ]
 
     # 문서 추가
-    success = vector_db.add_documents(sample_documents)
+    success = vector_db.add_documents_fast(sample_documents)
 
     if success:
         logger.info("✅ 샘플 반도체 문서 데이터 추가 완료")
@@ -1,10 +1,37 @@
 """
 MCP 서버 설정
 """
+import asyncio
+import logging
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
+
+def _env_positive_int(name: str) -> Optional[int]:
+    """
+    양의 정수 환경변수 조회
+    미설정 / 0 / 잘못된 값이면 None (잘못된 값은 경고 로그만 남기고 기본값 사용)
+    """
+    raw = os.getenv(name)
+    if not raw:
+        return None
+    try:
+        value = int(raw)
+    except ValueError:
+        value = -1
+    if value < 0:
+        logger.warning(f"⚠️ 잘못된 {name} 값 무시: {raw!r}")
+        return None
+    return value or None
+
+
+async def simulate_delay(config: "MCPConfig", seconds: float):
+    """시뮬레이션 지연 (simulate_latency 설정 시에만 대기, 그 외에는 이벤트 루프에 양보만 수행)"""
+    await asyncio.sleep(seconds if config.simulate_latency else 0)
+
 
 class MCPConfig:
     """MCP 서버 설정 관리"""
@@ -16,8 +43,23 @@ class MCPConfig:
         self.chunks_dir = self.data_dir / "chunks"
         self.vecdb_dir = self.data_dir / "vecdb"
 
+        # 시뮬레이션 지연(asyncio.sleep) 사용 여부 (개발/데모용)
+        self.simulate_latency = os.getenv("MCP_SIMULATE_LATENCY", "false").lower() in ("1", "true", "yes")
+
+        # 설정 딕셔너리는 한 번만 구성해 재사용
+        self._server_config = self._build_server_config()
+        self._tool_configs = self._build_tool_configs()
+
     def get_server_config(self) -> Dict[str, Any]:
         """MCP 서버 설정 반환"""
+        return self._server_config
+
+    def get_tool_config(self, tool_name: str) -> Dict[str, Any]:
+        """특정 Tool 설정 반환"""
+        return self._tool_configs.get(tool_name, {})
+
+    def _build_server_config(self) -> Dict[str, Any]:
+        """MCP 서버 설정 구성"""
         return {
             "name": "newera-mcp-server",
             "version": "1.0.0",
@@ -47,9 +89,9 @@ class MCPConfig:
             }
         }
 
-    def get_tool_config(self, tool_name: str) -> Dict[str, Any]:
-        """특정 Tool 설정 반환"""
-        configs = {
+    def _build_tool_configs(self) -> Dict[str, Dict[str, Any]]:
+        """Tool별 설정 구성"""
+        return {
             "web_crawler": {
                 "arxiv_categories": ["cs.AI", "cs.LG", "cs.CV"],
                 "max_papers": 100,
@@ -59,7 +101,8 @@ class MCPConfig:
                 "chunk_size": 512,
                 "chunk_overlap": 50,
                 "supported_formats": [".pdf", ".txt"],
-                "output_dir": str(self.chunks_dir)
+                "output_dir": str(self.chunks_dir),
+                "max_workers": _env_positive_int("PDF_PARSER_WORKERS")
             },
             "vector_db": {
                 "index_type": "HNSW",
@@ -76,4 +119,3 @@ class MCPConfig:
                 }
             }
         }
-        return configs.get(tool_name, {})
\ No newline at end of file
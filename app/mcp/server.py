@@ -4,7 +4,9 @@ MCP 프로토콜을 통해 AI Tool들을 노출
 """
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 from mcp.server import Server
@@ -26,6 +28,21 @@ from .tools.mongodb_tool import MongoDBTool
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# list_resources 결과 캐시 유지 시간 (초)
+RESOURCE_CACHE_TTL = 5.0
+
+
+def _walk_files(root: str) -> Iterator[str]:
+    """os.scandir 기반 재귀 파일 탐색 (DirEntry 타입 정보 재사용, 심볼릭 링크 디렉토리 제외)"""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+
 
 class NewEraMCPServer:
     """VirtualFab RAG System MCP Server"""
@@ -42,6 +59,9 @@ class NewEraMCPServer:
             "mongodb": MongoDBTool(self.config)
         }
 
+        # 리소스 목록 캐시 (생성 시각, 목록)
+        self._resource_cache: Optional[Tuple[float, List[Resource]]] = None
+
         logger.info("🎯 NewEra MCP Server 초기화 중...")
 
     async def list_tools(self) -> List[Tool]:
@@ -84,22 +104,27 @@ class NewEraMCPServer:
             )]
 
     async def list_resources(self) -> List[Resource]:
-        """MCP 리소스 목록 반환"""
+        """MCP 리소스 목록 반환 (짧은 TTL 동안 캐시)"""
+        now = time.monotonic()
+        if self._resource_cache and now - self._resource_cache[0] < RESOURCE_CACHE_TTL:
+            return self._resource_cache[1]
+
         resources = []
 
         # 데이터 디렉토리 구조를 리소스로 노출
-        data_dir = self.config.data_dir
-        if data_dir.exists():
-            for item in data_dir.rglob("*"):
-                if item.is_file():
-                    relative_path = item.relative_to(self.config.base_dir)
-                    resources.append(Resource(
-                        uri=f"file://{relative_path}",
-                        name=str(relative_path),
-                        description=f"Data file: {relative_path}",
-                        mimeType="application/octet-stream"
-                    ))
-
+        data_dir = str(self.config.data_dir)
+        base_dir = str(self.config.base_dir)
+        if os.path.isdir(data_dir):
+            for path in _walk_files(data_dir):
+                relative_path = os.path.relpath(path, base_dir)
+                resources.append(Resource(
+                    uri=f"file://{relative_path}",
+                    name=relative_path,
+                    description=f"Data file: {relative_path}",
+                    mimeType="application/octet-stream"
+                ))
+
+        self._resource_cache = (now, resources)
         return resources
 
     async def read_resource(self, uri: str) -> str:
@@ -108,7 +133,8 @@ class NewEraMCPServer:
             if uri.startswith("file://"):
                 file_path = self.config.base_dir / uri[7:]  # "file://" 제거
                 if file_path.exists():
-                    return file_path.read_text()
+                    # 파일 I/O는 스레드에서 수행해 이벤트 루프 블로킹 방지
+                    return await asyncio.to_thread(file_path.read_text, encoding="utf-8")
                 else:
                     return f"파일을 찾을 수 없습니다: {file_path}"
             else:
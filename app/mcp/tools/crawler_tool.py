@@ -8,6 +8,7 @@ from typing import Dict, Any, List
 from pathlib import Path
 
 from ..config import MCPConfig
+from ...core.crawler import ArXivCrawler, KeywordFilter
 
 logger = logging.getLogger(__name__)
 
@@ -15,12 +16,19 @@ logger = logging.getLogger(__name__)
 class WebCrawlerTool:
     """ArXiv 논문 크롤러 MCP Tool"""
 
+    __slots__ = ("config", "tool_config", "_tool_schema")
+
     def __init__(self, config: MCPConfig):
         self.config = config
         self.tool_config = config.get_tool_config("web_crawler")
+        self._tool_schema = self._build_tool_schema()
 
     def get_tool_schema(self) -> Dict[str, Any]:
         """MCP Tool 스키마 반환"""
+        return self._tool_schema
+
+    def _build_tool_schema(self) -> Dict[str, Any]:
+        """MCP Tool 스키마 구성"""
         return {
             "name": "web_crawler",
             "description": "ArXiv 논문 웹 크롤링 및 다운로드",
@@ -61,6 +69,8 @@ class WebCrawlerTool:
             # 실제 크롤링 로직 (간단한 시뮬레이션)
             results = await self._crawl_arxiv(categories, max_papers, keywords)
 
+            paper_lines = "\n".join([f"- {paper['title']} ({paper['id']})" for paper in results[:5]])
+
             return f"""✅ ArXiv 크롤링 완료
 
 📊 결과 요약:
@@ -72,7 +82,7 @@ class WebCrawlerTool:
 📁 저장 위치: {self.tool_config['output_dir']}
 
 📝 상세 결과:
-{chr(10).join(f"- {paper['title']} ({paper['id']})" for paper in results[:5])}
+{paper_lines}
 {f'... 외 {len(results) - 5}개' if len(results) > 5 else ''}"""
 
         except Exception as e:
@@ -81,9 +91,6 @@ class WebCrawlerTool:
 
     async def _crawl_arxiv(self, categories: List[str], max_papers: int, keywords: List[str]) -> List[Dict[str, Any]]:
         """ArXiv 크롤링 실행"""
-        from pathlib import Path
-        from ...core.crawler import ArXivCrawler, KeywordFilter
-
         # 크롤러 초기화
         output_dir = Path(self.tool_config["output_dir"])
         crawler = ArXivCrawler(output_dir=output_dir)
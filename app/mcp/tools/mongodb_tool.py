@@ -2,26 +2,57 @@
 MongoDB 관리 MCP Tool
 문서 저장소 관리 기능 제공
 """
-import asyncio
+import hashlib
+import json
 import logging
 from typing import Dict, Any, List
 from pathlib import Path
 
-from ..config import MCPConfig
+from ..config import MCPConfig, simulate_delay
 
 logger = logging.getLogger(__name__)
 
+# 샘플 검색 결과 (시뮬레이션용 고정값)
+_SAMPLE_DOCS = (
+    {"_id": "doc_0001", "title": "VirtualFab Overview", "type": "document"},
+    {"_id": "doc_0002", "title": "Digital Twin Architecture", "type": "document"},
+    {"_id": "doc_0003", "title": "Process Optimization", "type": "document"},
+)
+
+# 샘플 통계 (시뮬레이션용 고정값)
+_SAMPLE_STATS = {
+    "collections": {
+        "documents": {"count": 150, "size": "2.5 MB"},
+        "chunks": {"count": 2500, "size": "45.8 MB"},
+        "metadata": {"count": 25, "size": "0.3 MB"}
+    },
+    "total_size": "48.6 MB",
+    "connections": 5
+}
+
 
 class MongoDBTool:
     """MongoDB 관리 MCP Tool"""
 
+    __slots__ = ("config", "tool_config", "_tool_schema", "connection_string", "_stats_text", "_collections_text")
+
     def __init__(self, config: MCPConfig):
         self.config = config
         self.tool_config = config.get_tool_config("mongodb")
+        self._tool_schema = self._build_tool_schema()
         self.connection_string = None
+        self._stats_text = None
+        # 응답에 반복 사용되는 컬렉션 목록 문자열
+        self._collections_text = "\n".join(
+            [f"- {name}: {collection}" for name, collection in self.tool_config["collections"].items()]
+        )
 
     def get_tool_schema(self) -> Dict[str, Any]:
         """MCP Tool 스키마 반환"""
+        return self._tool_schema
+
+    def _build_tool_schema(self) -> Dict[str, Any]:
+        """MCP Tool 스키마 구성"""
         return {
             "name": "mongodb",
             "description": "MongoDB 문서 저장소 관리",
@@ -40,8 +71,8 @@ class MongoDBTool:
                         "default": self.tool_config["collections"]["documents"]
                     },
                     "data": {
-                        "type": "object",
-                        "description": "삽입할 데이터 (insert 시 필요)"
+                        "type": ["object", "array"],
+                        "description": "삽입할 데이터 (insert 시 필요, 배열이면 일괄 삽입)"
                     },
                     "query": {
                         "type": "object",
@@ -85,7 +116,7 @@ class MongoDBTool:
     async def _connect_db(self) -> str:
         """MongoDB 연결"""
         # 실제 연결 대신 시뮬레이션
-        await asyncio.sleep(0.3)
+        await simulate_delay(self.config, 0.3)
 
         self.connection_string = "mongodb://localhost:27017"
         database = self.tool_config["database"]
@@ -96,7 +127,7 @@ class MongoDBTool:
 🗄️ 데이터베이스: {database}
 
 📋 사용 가능한 컬렉션:
-{chr(10).join(f"- {name}: {collection}" for name, collection in self.tool_config["collections"].items())}"""
+{self._collections_text}"""
 
     async def _insert_document(self, args: Dict[str, Any]) -> str:
         """문서 삽입"""
@@ -106,10 +137,15 @@ class MongoDBTool:
         if not data:
             return "❌ data가 필요합니다."
 
+        if isinstance(data, list):
+            return await self._insert_many(collection, data)
+
         # 삽입 시뮬레이션
-        await asyncio.sleep(0.2)
+        await simulate_delay(self.config, 0.2)
+
+        doc_id = self._make_doc_id(data)
 
-        doc_id = f"doc_{hash(str(data)) % 10000:04d}"
+        data_lines = "\n".join([f"- {k}: {v}" for k, v in data.items()])
 
         return f"""✅ 문서 삽입 완료
 
@@ -117,7 +153,45 @@ class MongoDBTool:
 🆔 문서 ID: {doc_id}
 
 📝 삽입된 데이터:
-{chr(10).join(f"- {k}: {v}" for k, v in data.items())}"""
+{data_lines}"""
+
+    async def _insert_many(self, collection: str, documents: List[Dict[str, Any]]) -> str:
+        """
+        문서 일괄 삽입 (단일 왕복)
+        실제 DB 연결 없는 시뮬레이션: 문서 수와 무관하게 1회만 대기하고 ID만 생성
+        """
+        invalid = [i for i, doc in enumerate(documents) if not isinstance(doc, dict)]
+        if invalid:
+            return f"❌ 객체가 아닌 항목이 있습니다: 인덱스 {invalid[:10]}"
+
+        # 일괄 삽입 시뮬레이션
+        await simulate_delay(self.config, 0.2)
+
+        doc_ids = [self._make_doc_id(doc) for doc in documents]
+        id_lines = [f"- {doc_id}" for doc_id in doc_ids[:10]]
+        if len(doc_ids) > 10:
+            id_lines.append(f"... 외 {len(doc_ids) - 10}개")
+
+        id_text = "\n".join(id_lines)
+
+        return f"""✅ 문서 일괄 삽입 완료
+
+📄 컬렉션: {collection}
+📊 삽입된 문서 수: {len(doc_ids)}
+
+🆔 문서 ID:
+{id_text}"""
+
+    @staticmethod
+    def _make_doc_id(data: Dict[str, Any]) -> str:
+        """
+        문서 ID 생성
+        정렬된 키로 직렬화한 JSON의 blake2b 다이제스트 사용 (실행 간 동일 ID 보장)
+        """
+        payload = json.dumps(
+            data, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode("utf-8")
+        return f"doc_{hashlib.blake2b(payload, digest_size=6).hexdigest()}"
 
     async def _find_documents(self, args: Dict[str, Any]) -> str:
         """문서 검색"""
@@ -126,14 +200,12 @@ class MongoDBTool:
         limit = args.get("limit", 10)
 
         # 검색 시뮬레이션
-        await asyncio.sleep(0.3)
+        await simulate_delay(self.config, 0.3)
 
         # 샘플 결과
-        sample_docs = [
-            {"_id": "doc_0001", "title": "VirtualFab Overview", "type": "document"},
-            {"_id": "doc_0002", "title": "Digital Twin Architecture", "type": "document"},
-            {"_id": "doc_0003", "title": "Process Optimization", "type": "document"}
-        ][:limit]
+        sample_docs = _SAMPLE_DOCS[:limit]
+
+        doc_lines = "\n".join([f"- {doc['_id']}: {doc['title']} ({doc['type']})" for doc in sample_docs])
 
         return f"""✅ 문서 검색 완료
 
@@ -142,39 +214,35 @@ class MongoDBTool:
 📊 반환 문서 수: {len(sample_docs)}
 
 📝 검색 결과:
-{chr(10).join(f"- {doc['_id']}: {doc['title']} ({doc['type']})" for doc in sample_docs)}"""
+{doc_lines}"""
 
     async def _get_stats(self) -> str:
         """DB 통계"""
         # 통계 조회 시뮬레이션
-        await asyncio.sleep(0.2)
-
-        stats = {
-            "database": self.tool_config["database"],
-            "collections": {
-                "documents": {"count": 150, "size": "2.5 MB"},
-                "chunks": {"count": 2500, "size": "45.8 MB"},
-                "metadata": {"count": 25, "size": "0.3 MB"}
-            },
-            "total_size": "48.6 MB",
-            "connections": 5
-        }
+        await simulate_delay(self.config, 0.2)
 
-        return f"""📊 MongoDB 통계
+        # 통계 내용이 고정이므로 최초 1회만 문자열 생성
+        if self._stats_text is None:
+            collection_lines = "\n".join(
+                [f"- {name}: {info['count']} 문서, {info['size']}" for name, info in _SAMPLE_STATS['collections'].items()]
+            )
+            self._stats_text = f"""📊 MongoDB 통계
 
-🗄️ 데이터베이스: {stats['database']}
-📏 총 크기: {stats['total_size']}
-🔗 활성 연결: {stats['connections']}
+🗄️ 데이터베이스: {self.tool_config['database']}
+📏 총 크기: {_SAMPLE_STATS['total_size']}
+🔗 활성 연결: {_SAMPLE_STATS['connections']}
 
 📋 컬렉션별 정보:
-{chr(10).join(f"- {name}: {info['count']} 문서, {info['size']}" for name, info in stats['collections'].items())}"""
+{collection_lines}"""
+
+        return self._stats_text
 
     async def _clear_collection(self, args: Dict[str, Any]) -> str:
         """컬렉션 비우기"""
         collection = args.get("collection", self.tool_config["collections"]["documents"])
 
         # 삭제 시뮬레이션
-        await asyncio.sleep(0.5)
+        await simulate_delay(self.config, 0.5)
 
         return f"""✅ 컬렉션 비우기 완료
 
@@ -3,24 +3,51 @@ PDF Parser MCP Tool
 PDF 문서 파싱 및 청킹 기능 제공
 """
 import asyncio
+import atexit
+import hashlib
+import json
 import logging
-from typing import Dict, Any, List
+import multiprocessing
+import re
+import threading
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 
 from ..config import MCPConfig
 
 logger = logging.getLogger(__name__)
 
+try:
+    import fitz  # PyMuPDF
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+    logger.warning("⚠️ PyMuPDF 미설치: PDF 텍스트 추출 불가")
+
+# 청킹 결과 캐시 최대 항목 수
+CHUNK_CACHE_SIZE = 128
+
 
 class PDFParserTool:
     """PDF 파서 MCP Tool"""
 
+    __slots__ = ("config", "tool_config", "_tool_schema", "_chunk_cache")
+
     def __init__(self, config: MCPConfig):
         self.config = config
         self.tool_config = config.get_tool_config("pdf_parser")
+        self._tool_schema = self._build_tool_schema()
+        # (경로, mtime_ns, chunk_size, overlap, pages) -> 청크 리스트 (LRU)
+        self._chunk_cache: "OrderedDict[Tuple, List[str]]" = OrderedDict()
 
     def get_tool_schema(self) -> Dict[str, Any]:
         """MCP Tool 스키마 반환"""
+        return self._tool_schema
+
+    def _build_tool_schema(self) -> Dict[str, Any]:
+        """MCP Tool 스키마 구성"""
         return {
             "name": "pdf_parser",
             "description": "PDF 문서 파싱 및 텍스트 청킹",
@@ -31,6 +58,11 @@ class PDFParserTool:
                         "type": "string",
                         "description": "파싱할 PDF 파일 경로"
                     },
+                    "file_paths": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "일괄 파싱할 PDF 파일 경로 목록 (지정 시 file_path 대신 사용)"
+                    },
                     "chunk_size": {
                         "type": "integer",
                         "description": "청크 크기 (토큰 수)",
@@ -45,9 +77,13 @@ class PDFParserTool:
                         "type": "string",
                         "description": "청크 저장 디렉토리",
                         "default": self.tool_config["output_dir"]
+                    },
+                    "pages": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "description": "추출할 페이지 번호 목록 (1부터 시작, 생략 시 전체)"
                     }
-                },
-                "required": ["file_path"]
+                }
             }
         }
 
@@ -55,35 +91,25 @@ class PDFParserTool:
         """Tool 실행"""
         try:
             file_path = arguments.get("file_path")
+            file_paths = arguments.get("file_paths")
             chunk_size = arguments.get("chunk_size", self.tool_config["chunk_size"])
             chunk_overlap = arguments.get("chunk_overlap", self.tool_config["chunk_overlap"])
             output_dir = Path(arguments.get("output_dir", self.tool_config["output_dir"]))
+            pages = arguments.get("pages")
+
+            if file_paths:
+                return await self._execute_batch(file_paths, chunk_size, chunk_overlap, output_dir, pages)
 
             if not file_path:
-                return "❌ file_path가 필요합니다."
+                return "❌ file_path 또는 file_paths가 필요합니다."
 
             file_path = Path(file_path)
             if not file_path.exists():
                 return f"❌ 파일을 찾을 수 없습니다: {file_path}"
 
-            logger.info(f"📄 PDF 파싱 시작: {file_path}")
-
-            # PDF 파싱 및 청킹
-            chunks = await self._parse_and_chunk_pdf(file_path, chunk_size, chunk_overlap)
-
-            # 청크 저장
-            output_dir.mkdir(parents=True, exist_ok=True)
-            chunk_file = output_dir / f"{file_path.stem}_chunks.json"
+            chunk_file, chunks = await self._process_file(file_path, chunk_size, chunk_overlap, output_dir, pages)
 
-            import json
-            with open(chunk_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "source_file": str(file_path),
-                    "chunk_size": chunk_size,
-                    "chunk_overlap": chunk_overlap,
-                    "total_chunks": len(chunks),
-                    "chunks": chunks
-                }, f, ensure_ascii=False, indent=2)
+            sample_lines = "\n".join([f"청크 {i+1}: {chunk[:100]}..." for i, chunk in enumerate(chunks[:3])])
 
             return f"""✅ PDF 파싱 및 청킹 완료
 
@@ -95,55 +121,263 @@ class PDFParserTool:
 - 저장 위치: {chunk_file}
 
 📝 샘플 청크:
-{chr(10).join(f"청크 {i+1}: {chunk[:100]}..." for i, chunk in enumerate(chunks[:3]))}"""
+{sample_lines}"""
 
         except Exception as e:
             logger.error(f"PDF 파싱 실패: {e}")
             return f"❌ PDF 파싱 실패: {str(e)}"
 
-    async def _parse_and_chunk_pdf(self, file_path: Path, chunk_size: int, overlap: int) -> List[str]:
-        """PDF 파싱 및 청킹 시뮬레이션"""
-        # 실제 구현에서는 PyMuPDF나 pdfplumber 사용
-        # 여기서는 샘플 텍스트 청킹
+    async def _execute_batch(
+        self,
+        file_paths: List[str],
+        chunk_size: int,
+        overlap: int,
+        output_dir: Path,
+        pages: Optional[List[int]] = None
+    ) -> str:
+        """여러 파일 동시 파싱 (동시 실행 수는 프로세스 풀 워커 수로 제한)"""
+        paths = [Path(p) for p in file_paths]
+        missing = [p for p in paths if not p.exists()]
+
+        # 같은 파일(심볼릭 링크 포함)이 여러 번 지정되면 한 번만 파싱
+        unique_paths: Dict[Path, Path] = {}
+        for p in paths:
+            if p.exists():
+                unique_paths.setdefault(p.resolve(), p)
+        paths = list(unique_paths.values())
+
+        logger.info(f"📚 PDF 일괄 파싱 시작: {len(paths)}개 파일")
+
+        # 출력 파일명(stem)이 겹치는 원본만 경로 해시를 붙여 출력 파일 충돌 방지
+        stem_counts = Counter(p.stem for p in paths)
+
+        outcomes = await asyncio.gather(
+            *(
+                self._process_file(p, chunk_size, overlap, output_dir, pages, stem_counts[p.stem] > 1)
+                for p in paths
+            ),
+            return_exceptions=True
+        )
+
+        result_lines = []
+        failed = 0
+        total_chunks = 0
+        for path, outcome in zip(paths, outcomes):
+            if isinstance(outcome, BaseException):
+                logger.error(f"PDF 파싱 실패: {path}: {outcome}")
+                result_lines.append(f"- ❌ {path.name}: {outcome}")
+                failed += 1
+            else:
+                chunk_file, chunks = outcome
+                total_chunks += len(chunks)
+                result_lines.append(f"- ✅ {path.name}: {len(chunks)}개 청크 → {chunk_file}")
+        result_lines.extend(f"- ❌ {p}: 파일을 찾을 수 없습니다" for p in missing)
+
+        result_text = "\n".join(result_lines)
+
+        return f"""✅ PDF 일괄 파싱 및 청킹 완료
+
+📊 처리 결과:
+- 요청 파일 수: {len(file_paths)}
+- 성공: {len(paths) - failed} / 실패: {failed + len(missing)}
+- 청크 크기: {chunk_size} 토큰
+- 청크 오버랩: {overlap} 토큰
+- 총 생성 청크 수: {total_chunks}
+
+📝 파일별 결과:
+{result_text}"""
+
+    async def _process_file(
+        self,
+        file_path: Path,
+        chunk_size: int,
+        overlap: int,
+        output_dir: Path,
+        pages: Optional[List[int]] = None,
+        unique_name: bool = False
+    ) -> Tuple[Path, List[str]]:
+        """단일 파일 파싱/청킹 후 청크 파일 저장 (unique_name이면 파일명에 경로 해시 추가)"""
+        logger.info(f"📄 PDF 파싱 시작: {file_path}")
+
+        # PDF 파싱 및 청킹 (동일 파일/파라미터면 캐시 재사용)
+        resolved_path = str(file_path.resolve())
+        cache_key = (
+            resolved_path,
+            file_path.stat().st_mtime_ns,
+            chunk_size,
+            overlap,
+            tuple(pages) if pages is not None else None
+        )
+        chunks = self._chunk_cache.get(cache_key)
+        if chunks is None:
+            chunks = await self._parse_and_chunk_pdf(file_path, chunk_size, overlap, pages)
+            self._chunk_cache[cache_key] = chunks
+            if len(self._chunk_cache) > CHUNK_CACHE_SIZE:
+                self._chunk_cache.popitem(last=False)
+        else:
+            self._chunk_cache.move_to_end(cache_key)
+            logger.info(f"♻️ 청크 캐시 사용: {file_path.name}")
+
+        # 청크 저장 (직렬화/쓰기는 스레드에서 수행해 이벤트 루프 차단 방지)
+        chunk_file = output_dir / _chunk_file_name(file_path, resolved_path, unique_name)
+        await asyncio.to_thread(_write_chunk_file, chunk_file, {
+            "source_file": str(file_path),
+            "chunk_size": chunk_size,
+            "chunk_overlap": overlap,
+            "total_chunks": len(chunks),
+            "chunks": chunks
+        })
+
+        return chunk_file, chunks
+
+    async def _parse_and_chunk_pdf(
+        self,
+        file_path: Path,
+        chunk_size: int,
+        overlap: int,
+        pages: Optional[List[int]] = None
+    ) -> List[str]:
+        """PDF 파싱 및 청킹 (CPU 작업은 프로세스 풀에서 실행)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_process_pool(self.tool_config.get("max_workers")),
+            _parse_and_chunk_file,
+            file_path,
+            chunk_size,
+            overlap,
+            pages
+        )
+
+
+# 단어(공백 이외 문자열) 경계 패턴
+_WORD_PATTERN = re.compile(r"\S+")
+
+# 프로세스 풀 (최초 사용 시 생성, 프로세스 전역 공유)
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    PDF 파싱용 프로세스 풀 반환
+    스레드가 이미 실행 중인 프로세스에서 fork하지 않도록 spawn 컨텍스트 사용,
+    종료 시 atexit으로 워커 정리
+    """
+    global _process_pool
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                atexit.register(_shutdown_process_pool)
+    return _process_pool
+
+
+def _shutdown_process_pool():
+    """프로세스 풀 종료 (인터프리터 종료 시 호출)"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=True, cancel_futures=True)
+            _process_pool = None
+
+
+def _chunk_file_name(file_path: Path, resolved_path: str, unique: bool = False) -> str:
+    """
+    청크 파일명 생성 ({stem}_chunks.json)
+    unique이면 디렉토리가 다른 동명 원본끼리 충돌하지 않도록 절대 경로 해시를 덧붙임
+    """
+    if not unique:
+        return f"{file_path.stem}_chunks.json"
+    path_hash = hashlib.blake2b(resolved_path.encode("utf-8"), digest_size=4).hexdigest()
+    return f"{file_path.stem}_{path_hash}_chunks.json"
+
+
+def _write_chunk_file(chunk_file: Path, payload: Dict[str, Any]):
+    """
+    청크 JSON 저장
+    json.dump(파일 객체)는 순수 Python 인코더를 거치므로 json.dumps(C 인코더)로 한 번에 직렬화 후 기록
+    """
+    chunk_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(chunk_file, 'w', encoding='utf-8') as f:
+        f.write(json.dumps(payload, ensure_ascii=False, separators=(",", ":")))
+
+
+def _extract_text(file_path: Path, pages: Optional[List[int]] = None) -> str:
+    """
+    문서 텍스트 추출 (PDF는 PyMuPDF 사용)
+    페이지 텍스트를 리스트로 모은 뒤 한 번에 join
+
+    Args:
+        file_path: 문서 경로 (.pdf / .txt)
+        pages: 추출할 페이지 번호 목록 (1부터 시작, None이면 전체)
+
+    Returns:
+        추출된 텍스트
+    """
+    if file_path.suffix.lower() != ".pdf":
+        return file_path.read_text(encoding="utf-8")
+
+    if not PYMUPDF_AVAILABLE:
+        raise RuntimeError("PyMuPDF(pymupdf)가 설치되지 않았습니다.")
+
+    with fitz.open(file_path) as doc:
+        if pages is None:
+            page_indices = range(doc.page_count)
+        else:
+            page_indices = [p - 1 for p in pages if 1 <= p <= doc.page_count]
+
+        parts = [doc.load_page(i).get_text("text") for i in page_indices]
+
+    return "\n".join(parts)
 
-        await asyncio.sleep(0.5)  # 파싱 시뮬레이션
 
-        # 샘플 텍스트 (실제로는 PDF에서 추출)
-        sample_text = """
-        VirtualFab: Digital Twin for Semiconductor Manufacturing
+def _parse_and_chunk_file(
+    file_path: Path,
+    chunk_size: int,
+    overlap: int,
+    pages: Optional[List[int]] = None
+) -> List[str]:
+    """텍스트 추출 + 청킹 (프로세스 풀 워커에서 실행)"""
+    text = _extract_text(file_path, pages)
+    return _chunk_text(text, chunk_size, overlap)
 
-        Abstract: This paper presents VirtualFab, a comprehensive digital twin system
-        for semiconductor manufacturing facilities. VirtualFab integrates real-time
-        sensor data, process models, and machine learning algorithms to create
-        accurate virtual representations of physical fabrication processes.
 
-        Introduction: Semiconductor manufacturing is becoming increasingly complex
-        with shrinking feature sizes and growing process variability. Digital twins
-        offer a promising approach to optimize manufacturing operations, predict
-        equipment failures, and improve yield rates.
+def _chunk_text(text: str, chunk_size: int, overlap: int) -> List[str]:
+    """
+    단어 단위 청킹
+    단어별 문자열을 만들지 않고 단어 경계 오프셋만 기록한 뒤,
+    청크마다 원문을 한 번씩 슬라이스
 
-        System Architecture: VirtualFab consists of three main components:
-        1. Data Acquisition Layer: Collects data from various sensors and equipment
-        2. Modeling Layer: Creates physics-based and data-driven models
-        3. Optimization Layer: Uses reinforcement learning for process optimization
+    Args:
+        text: 원문 텍스트
+        chunk_size: 청크당 단어 수
+        overlap: 청크 간 겹치는 단어 수
 
-        Results: VirtualFab achieved 15% improvement in cycle time and 20% reduction
-        in defect rates compared to traditional methods.
-        """
+    Returns:
+        청크 문자열 리스트
+    """
+    starts: List[int] = []
+    ends: List[int] = []
+    for match in _WORD_PATTERN.finditer(text):
+        starts.append(match.start())
+        ends.append(match.end())
 
-        # 간단한 텍스트 청킹 (실제로는 더 정교한 알고리즘 사용)
-        words = sample_text.split()
-        chunks = []
+    stride = chunk_size - overlap
+    if chunk_size <= 0 or stride <= 0:
+        raise ValueError(f"잘못된 청크 설정: chunk_size={chunk_size}, chunk_overlap={overlap}")
 
-        i = 0
-        while i < len(words):
-            chunk_words = words[i:i + chunk_size]
-            chunk_text = " ".join(chunk_words)
-            chunks.append(chunk_text)
+    total_words = len(starts)
+    if total_words == 0:
+        return []
 
-            # 오버랩만큼 뒤로 이동
-            i += chunk_size - overlap
-            if i <= 0:  # 무한 루프 방지
-                break
+    # 슬라이딩 윈도우 시작 위치: 0, S, 2S, ... (마지막 윈도우가 끝 단어를 포함할 때까지)
+    # 청크 수 = ceil((N - K) / S) + 1 (N <= K 이면 1)
+    window_starts = range(0, max(total_words - chunk_size, 0) + stride, stride)
 
-        return chunks
\ No newline at end of file
+    return [
+        text[starts[i]:ends[min(i + chunk_size, total_words) - 1]]
+        for i in window_starts
+    ]
@@ -4,24 +4,39 @@ FAISS Vector DB 관리 기능 제공
 """
 import asyncio
 import logging
+import os
 from typing import Dict, Any, List
 from pathlib import Path
 import json
 
-from ..config import MCPConfig
+from ..config import MCPConfig, simulate_delay
 
 logger = logging.getLogger(__name__)
 
+# 샘플 검색 결과 (시뮬레이션용 고정값)
+_SAMPLE_RESULTS = (
+    {"id": 0, "score": 0.95, "text": "VirtualFab digital twin implementation..."},
+    {"id": 1, "score": 0.89, "text": "Semiconductor manufacturing optimization..."},
+    {"id": 2, "score": 0.87, "text": "Predictive maintenance using ML..."},
+)
+
 
 class VectorDBTool:
     """VectorDB 관리 MCP Tool"""
 
+    __slots__ = ("config", "tool_config", "_tool_schema")
+
     def __init__(self, config: MCPConfig):
         self.config = config
         self.tool_config = config.get_tool_config("vector_db")
+        self._tool_schema = self._build_tool_schema()
 
     def get_tool_schema(self) -> Dict[str, Any]:
         """MCP Tool 스키마 반환"""
+        return self._tool_schema
+
+    def _build_tool_schema(self) -> Dict[str, Any]:
+        """MCP Tool 스키마 구성"""
         return {
             "name": "vector_db",
             "description": "FAISS Vector DB 생성, 검색, 관리",
@@ -89,19 +104,18 @@ class VectorDBTool:
         if not chunks_file.exists():
             return f"❌ 청크 파일을 찾을 수 없습니다: {chunks_file}"
 
-        # 청크 파일 로드
-        with open(chunks_file, 'r', encoding='utf-8') as f:
-            chunks_data = json.load(f)
+        # 청크 파일 로드 (스레드에서 읽어 이벤트 루프 차단 방지)
+        chunks_data = await asyncio.to_thread(_read_json, chunks_file)
 
         chunks = chunks_data["chunks"]
         total_chunks = len(chunks)
 
         # FAISS 인덱스 생성 시뮬레이션
-        await asyncio.sleep(1)
+        await simulate_delay(self.config, 1)
 
         # 메타데이터 저장
-        db_path.mkdir(parents=True, exist_ok=True)
         metadata_file = db_path / "metadata.json"
+        index_file = db_path / "index.faiss"
 
         metadata = {
             "dimension": self.tool_config["dimension"],
@@ -112,13 +126,7 @@ class VectorDBTool:
             "created_at": str(asyncio.get_event_loop().time())
         }
 
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2)
-
-        # 인덱스 파일 시뮬레이션
-        index_file = db_path / "index.faiss"
-        with open(index_file, 'w') as f:
-            f.write(f"FAISS Index Simulation - {total_chunks} vectors")
+        await asyncio.to_thread(_write_db_files, db_path, metadata_file, metadata, index_file)
 
         return f"""✅ Vector DB 생성 완료
 
@@ -146,14 +154,12 @@ class VectorDBTool:
             return f"❌ Vector DB를 찾을 수 없습니다: {db_path}"
 
         # 검색 시뮬레이션
-        await asyncio.sleep(0.5)
+        await simulate_delay(self.config, 0.5)
 
         # 샘플 검색 결과
-        results = [
-            {"id": 0, "score": 0.95, "text": "VirtualFab digital twin implementation..."},
-            {"id": 1, "score": 0.89, "text": "Semiconductor manufacturing optimization..."},
-            {"id": 2, "score": 0.87, "text": "Predictive maintenance using ML..."}
-        ][:top_k]
+        results = _SAMPLE_RESULTS[:top_k]
+
+        result_lines = "\n".join([f"{i+1}. [점수: {r['score']:.3f}] {r['text'][:100]}..." for i, r in enumerate(results)])
 
         return f"""✅ Vector DB 검색 완료
 
@@ -161,7 +167,7 @@ class VectorDBTool:
 📊 반환 결과 수: {len(results)}
 
 📝 검색 결과:
-{chr(10).join(f"{i+1}. [점수: {r['score']:.3f}] {r['text'][:100]}..." for i, r in enumerate(results))}"""
+{result_lines}"""
 
     async def _get_stats(self, db_path: Path) -> str:
         """DB 통계 정보"""
@@ -170,13 +176,17 @@ class VectorDBTool:
 
         metadata_file = db_path / "metadata.json"
         if metadata_file.exists():
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
+            metadata = await asyncio.to_thread(_read_json, metadata_file)
         else:
             metadata = {"total_vectors": 0, "dimension": self.tool_config["dimension"]}
 
-        # 파일 크기 계산
-        total_size = sum(f.stat().st_size for f in db_path.glob("*") if f.is_file())
+        # 파일 크기 계산 (scandir 엔트리의 캐시된 정보 사용)
+        with os.scandir(db_path) as entries:
+            total_size = sum(
+                entry.stat(follow_symlinks=False).st_size
+                for entry in entries
+                if entry.is_file(follow_symlinks=False)
+            )
 
         return f"""📊 Vector DB 통계
 
@@ -195,10 +205,28 @@ class VectorDBTool:
             return f"❌ Vector DB를 찾을 수 없습니다: {db_path}"
 
         # 삭제 시뮬레이션
-        await asyncio.sleep(0.2)
+        await simulate_delay(self.config, 0.2)
 
         # 실제로는 shutil.rmtree 사용
         return f"""✅ Vector DB 삭제 완료
 
 🗑️ 삭제된 경로: {db_path}
-⚠️ 실제 파일 삭제는 안전을 위해 수동으로 수행하세요."""
\ No newline at end of file
+⚠️ 실제 파일 삭제는 안전을 위해 수동으로 수행하세요."""
+
+
+def _read_json(path: Path) -> Any:
+    """JSON 파일 로드 (바이트로 읽어 json.loads가 직접 디코딩)"""
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+
+def _write_db_files(db_path: Path, metadata_file: Path, metadata: Dict[str, Any], index_file: Path):
+    """메타데이터 및 인덱스 파일 저장"""
+    db_path.mkdir(parents=True, exist_ok=True)
+
+    with open(metadata_file, 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, separators=(",", ":"))
+
+    # 인덱스 파일 시뮬레이션
+    with open(index_file, 'w') as f:
+        f.write(f"FAISS Index Simulation - {metadata['total_vectors']} vectors")
@@ -0,0 +1,17 @@
+"""
+Memory Package
+대화 메모리 기능 제공
+"""
+from .base import BaseMemory
+from .conversation_simple import (
+    SimpleConversationMemory,
+    get_conversation_memory,
+    clear_all_memories,
+)
+
+__all__ = [
+    "BaseMemory",
+    "SimpleConversationMemory",
+    "get_conversation_memory",
+    "clear_all_memories",
+]
@@ -3,8 +3,12 @@ Memory 베이스 인터페이스
 LangChain Memory 시스템의 기본 인터페이스
 """
 from abc import ABC, abstractmethod
+from itertools import starmap
 from typing import Any, Dict, List, Optional
 
+# 대화 컨텍스트 포맷 템플릿
+_CONTEXT_TEMPLATE = "Human: {}\nAI: {}"
+
 
 class BaseMemory(ABC):
     """
@@ -81,12 +85,7 @@ class BaseMemory(ABC):
         if not context_list:
             return ""
 
-        formatted = []
-        for ctx in context_list:
-            human = ctx.get("human", "")
-            ai = ctx.get("ai", "")
-            if human and ai:
-                formatted.append(f"Human: {human}\nAI: {ai}")
-
-        return "\n\n".join(formatted)
+        # (human, ai) 쌍을 한 번만 조회한 뒤 템플릿 format으로 일괄 포맷팅
+        pairs = ((ctx.get("human"), ctx.get("ai")) for ctx in context_list)
+        return "\n\n".join(starmap(_CONTEXT_TEMPLATE.format, ((h, a) for h, a in pairs if h and a)))
 
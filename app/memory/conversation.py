@@ -4,9 +4,6 @@ LangChain ConversationBufferMemory 기반 구현
 """
 import logging
 from typing import Any, Dict, List, Optional
-from functools import lru_cache
-
-from langchain.memory import ConversationBufferMemory
 
 from .base import BaseMemory
 
@@ -24,8 +21,10 @@ class ConversationBufferMemory(BaseMemory):
         self.logger = logger
         self.max_token_limit = max_token_limit
 
-        # LangChain ConversationBufferMemory 초기화
-        self.langchain_memory = ConversationBufferMemory(
+        # LangChain ConversationBufferMemory 초기화 (langchain은 사용 시점에만 import)
+        from langchain.memory import ConversationBufferMemory as LangChainBufferMemory
+
+        self.langchain_memory = LangChainBufferMemory(
             memory_key=self.memory_key,
             max_token_limit=self.max_token_limit
         )
@@ -108,34 +107,3 @@ class ConversationBufferMemory(BaseMemory):
             변수 이름 리스트
         """
         return [self.memory_key]
-
-
-# 간단한 메모리 인스턴스 관리
-_memory_instances = {}
-
-
-def get_conversation_memory(memory_key: str = "default") -> ConversationBufferMemory:
-    """
-    대화 메모리 인스턴스
-
-    Args:
-        memory_key: 메모리 키
-
-    Returns:
-        ConversationBufferMemory 인스턴스
-    """
-    if memory_key not in _memory_instances:
-        _memory_instances[memory_key] = ConversationBufferMemory(memory_key=memory_key)
-
-    return _memory_instances[memory_key]
-
-
-def clear_all_memories():
-    """
-    모든 메모리 인스턴스 클리어
-    """
-    global _memory_instances
-    for memory in _memory_instances.values():
-        memory.clear()
-    _memory_instances.clear()
-    logger.info("🧹 모든 메모리 인스턴스 클리어됨")
@@ -3,7 +3,9 @@
 LangChain 대신 직접 구현
 """
 import logging
-from typing import Any, Dict, List, Optional
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional
 
 from .base import BaseMemory
 
@@ -20,8 +22,8 @@ class SimpleConversationMemory(BaseMemory):
         super().__init__(memory_key)
         self.logger = logger
 
-        # 간단한 메모리 저장소
-        self.buffer: List[Dict[str, Any]] = []
+        # 간단한 메모리 저장소 (최대 10개 대화 유지, 초과 시 오래된 항목 자동 제거)
+        self.buffer: Deque[Dict[str, Any]] = deque(maxlen=10)
 
         logger.info(f"💬 Simple Conversation Memory 초기화: {memory_key}")
 
@@ -48,10 +50,6 @@ class SimpleConversationMemory(BaseMemory):
                 "timestamp": None
             })
 
-            # 버퍼 크기 제한 (최대 10개 대화 유지)
-            if len(self.buffer) > 10:
-                self.buffer = self.buffer[-10:]
-
             logger.debug(f"💾 메모리 저장: {len(human_input)}자 입력")
 
         except Exception as e:
@@ -71,14 +69,13 @@ class SimpleConversationMemory(BaseMemory):
             if not self.buffer:
                 return {self.memory_key: ""}
 
-            # 최근 대화들을 문자열로 변환
-            memory_text = ""
-            for item in self.buffer[-5:]:  # 최근 5개만
-                memory_text += f"Human: {item['human']}\nAI: {item['ai']}\n\n"
+            # 최근 대화들을 문자열로 변환 (최근 5개만)
+            recent = islice(self.buffer, max(len(self.buffer) - 5, 0), None)
+            memory_text = "\n\n".join(f"Human: {item['human']}\nAI: {item['ai']}" for item in recent)
 
             logger.debug(f"메모리 로드: {len(self.buffer)}개 대화")
 
-            return {self.memory_key: memory_text.strip()}
+            return {self.memory_key: memory_text}
 
         except Exception as e:
             logger.error(f"메모리 로드 실패: {e}", exc_info=True)
@@ -115,7 +112,7 @@ class SimpleConversationMemory(BaseMemory):
 
 
 # 간단한 메모리 인스턴스 관리
-_memory_instances = {}
+_memory_instances: Dict[str, SimpleConversationMemory] = {}
 
 
 def get_conversation_memory(memory_key: str = "default") -> SimpleConversationMemory:
@@ -128,17 +125,17 @@ def get_conversation_memory(memory_key: str = "default") -> SimpleConversationMe
     Returns:
         SimpleConversationMemory 인스턴스
     """
-    if memory_key not in _memory_instances:
-        _memory_instances[memory_key] = SimpleConversationMemory(memory_key=memory_key)
+    memory = _memory_instances.get(memory_key)
+    if memory is None:
+        memory = _memory_instances[memory_key] = SimpleConversationMemory(memory_key=memory_key)
 
-    return _memory_instances[memory_key]
+    return memory
 
 
 def clear_all_memories():
     """
     모든 메모리 인스턴스 클리어
     """
-    global _memory_instances
     for memory in _memory_instances.values():
         memory.clear()
     _memory_instances.clear()
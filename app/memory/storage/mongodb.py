@@ -3,6 +3,7 @@ MongoDB Memory Storage (Dummy Implementation)
 LangChain Memory를 위한 MongoDB 백엔드
 """
 import logging
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -15,8 +16,14 @@ class MongoDBMemoryStore:
     TODO: 실제 MongoDB 연결 구현
     """
 
+    __slots__ = (
+        "connection_string", "database", "collection", "logger", "is_connected", "dummy_data", "max_items",
+        "client", "db",  # 실제 MongoDB 연결 시 connect()에서 설정
+    )
+
     def __init__(self, connection_string: str = "mongodb://localhost:27017",
-                 database: str = "rag_memory", collection: str = "conversations"):
+                 database: str = "rag_memory", collection: str = "conversations",
+                 max_items: int = 10000):
         self.connection_string = connection_string
         self.database = database
         self.collection = collection
@@ -24,7 +31,9 @@ class MongoDBMemoryStore:
 
         # Dummy 상태
         self.is_connected = False
-        self.dummy_data = {}  # 메모리 내 저장 (실제로는 MongoDB)
+        # 메모리 내 저장 (실제로는 MongoDB), 최근 사용 순 LRU로 max_items개까지 유지
+        self.dummy_data: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.max_items = max_items
 
         logger.warning("⚠️ MongoDB Memory Store: Dummy 모드 (실제 DB 연결 없음)")
 
@@ -63,7 +72,11 @@ class MongoDBMemoryStore:
         try:
             # TODO: 실제 MongoDB 저장 구현
             self.dummy_data[memory_key] = data
-            logger.debug(f"💾 메모리 저장 (Dummy): {memory_key}")
+            self.dummy_data.move_to_end(memory_key)
+            if len(self.dummy_data) > self.max_items:
+                evicted_key, _ = self.dummy_data.popitem(last=False)
+                logger.debug("♻️ 오래된 메모리 제거 (Dummy): %s", evicted_key)
+            logger.debug("💾 메모리 저장 (Dummy): %s", memory_key)
             return True
 
         except Exception as e:
@@ -83,8 +96,9 @@ class MongoDBMemoryStore:
         try:
             # TODO: 실제 MongoDB 로드 구현
             data = self.dummy_data.get(memory_key)
-            if data:
-                logger.debug(f"📖 메모리 로드 (Dummy): {memory_key}")
+            if data is not None:
+                self.dummy_data.move_to_end(memory_key)
+                logger.debug("📖 메모리 로드 (Dummy): %s", memory_key)
             return data
 
         except Exception as e:
@@ -105,7 +119,7 @@ class MongoDBMemoryStore:
             # TODO: 실제 MongoDB 삭제 구현
             if memory_key in self.dummy_data:
                 del self.dummy_data[memory_key]
-                logger.debug(f"🗑️ 메모리 삭제 (Dummy): {memory_key}")
+                logger.debug("🗑️ 메모리 삭제 (Dummy): %s", memory_key)
             return True
 
         except Exception as e:
@@ -122,13 +136,22 @@ class MongoDBMemoryStore:
         try:
             # TODO: 실제 MongoDB 쿼리 구현
             keys = list(self.dummy_data.keys())
-            logger.debug(f"📋 메모리 목록 (Dummy): {len(keys)}개")
+            logger.debug("📋 메모리 목록 (Dummy): %d개", len(keys))
             return keys
 
         except Exception as e:
             logger.error(f"메모리 목록 조회 실패: {e}")
             return []
 
+    def count_memories(self) -> int:
+        """
+        저장된 메모리 수 (키 목록을 만들지 않음)
+
+        Returns:
+            메모리 수
+        """
+        return len(self.dummy_data)
+
     def clear_all(self) -> bool:
         """
         모든 메모리 데이터 클리어 (Dummy)
@@ -138,7 +161,8 @@ class MongoDBMemoryStore:
         """
         try:
             # TODO: 실제 MongoDB 클리어 구현
-            self.dummy_data.clear()
+            # 항목별 정리 대신 새 컨테이너로 교체 (기존 데이터는 참조 해제로 일괄 회수)
+            self.dummy_data = OrderedDict()
             logger.info("🧹 모든 메모리 클리어됨 (Dummy)")
             return True
 
@@ -154,7 +178,8 @@ class MongoDBMemoryStore:
             통계 정보
         """
         return {
-            "total_memories": len(self.dummy_data),
+            "total_memories": self.count_memories(),
+            "max_items": self.max_items,
             "connection_status": "dummy_connected" if self.is_connected else "disconnected",
             "backend": "mongodb_dummy",
             "note": "실제 MongoDB 연결이 구현되지 않았습니다"
@@ -2,7 +2,10 @@
 MCP Tools LangChain 래핑
 기존 MCP Tools를 LangChain Tool로 변환
 """
+import asyncio
 import logging
+import re
+import threading
 from typing import Any, Dict, Optional, Type
 from functools import lru_cache
 
@@ -17,12 +20,48 @@ from ..mcp.config import MCPConfig
 
 logger = logging.getLogger(__name__)
 
+# 쿼리 → 작업 라우팅 키워드 패턴 (한 번의 스캔으로 포함된 키워드 수집)
+_VECTOR_DB_ACTION_PATTERN = re.compile(r"search|create|delete", re.IGNORECASE)
+_MONGODB_ACTION_PATTERN = re.compile(r"find|search|insert", re.IGNORECASE)
+
+# 동기 Tool 호출용 백그라운드 이벤트 루프 (최초 사용 시 생성, 프로세스 전역 공유)
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_lock = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """데몬 스레드에서 실행 중인 백그라운드 이벤트 루프 반환"""
+    global _bg_loop
+    if _bg_loop is None:
+        with _bg_lock:
+            if _bg_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever,
+                    name="mcp-tool-loop",
+                    daemon=True
+                ).start()
+                _bg_loop = loop
+    return _bg_loop
+
+
+def _has_running_loop() -> bool:
+    """현재 스레드에서 이벤트 루프가 실행 중인지 여부"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
 
 class MCPToolWrapper(BaseTool):
     """
     MCP Tool을 LangChain Tool로 래핑하는 베이스 클래스
     """
 
+    # 래핑 대상 MCP Tool 인스턴스 (pydantic 필드로 선언해야 인스턴스에 저장 가능)
+    mcp_tool: Any = None
+
     def __init__(self, mcp_tool_instance, tool_name: str, description: str):
         super().__init__(
             name=tool_name,
@@ -31,6 +70,19 @@ class MCPToolWrapper(BaseTool):
         )
         self.mcp_tool = mcp_tool_instance
 
+    def run_direct(self, query: str) -> str:
+        """
+        LangChain 콜백/입력 검증을 거치지 않는 직접 실행
+        에이전트 외부에서 MCP Tool을 반복 호출할 때 사용
+
+        Args:
+            query: 쿼리 문자열
+
+        Returns:
+            MCP Tool 실행 결과
+        """
+        return self._run(query)
+
     def _run(self, query: str, run_manager: Optional[CallbackManagerForToolRun] = None) -> str:
         """
         동기 실행 (LangChain 요구사항)
@@ -39,15 +91,17 @@ class MCPToolWrapper(BaseTool):
             # MCP Tool 실행을 위한 인자 변환
             arguments = self._parse_query_to_args(query)
 
-            # 비동기 함수를 동기로 실행 (임시)
-            import asyncio
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(self.mcp_tool.execute(arguments))
-                return result
-            finally:
-                loop.close()
+            # 결과 대기 동안 호출한 스레드가 블록되므로, 실행 중인 이벤트 루프 안(백그라운드 루프 스레드 포함)에서는
+            # 루프 정지 / 교착을 막기 위해 거부하고 비동기 경로(_arun)를 사용하도록 안내
+            if _has_running_loop():
+                raise RuntimeError("실행 중인 이벤트 루프에서는 동기 실행할 수 없습니다. 비동기 호출(ainvoke)을 사용하세요.")
+
+            # 비동기 함수를 백그라운드 루프에 제출하고 결과 대기 (호출마다 이벤트 루프를 생성/종료하지 않음)
+            future = asyncio.run_coroutine_threadsafe(
+                self.mcp_tool.execute(arguments),
+                _get_background_loop()
+            )
+            return future.result()
 
         except Exception as e:
             logger.error(f"MCP Tool 실행 실패 ({self.name}): {e}")
@@ -140,7 +194,8 @@ class VectorDBTool(MCPToolWrapper):
     def _parse_query_to_args(self, query: str) -> Dict[str, Any]:
         """벡터 DB 작업 파싱"""
         # 간단한 파싱 로직 (실제로는 더 정교하게)
-        if "search" in query.lower():
+        found = {m.lower() for m in _VECTOR_DB_ACTION_PATTERN.findall(query)}
+        if "search" in found:
             action = "search"
             search_query = query.replace("search", "").strip()
             return {
@@ -148,9 +203,9 @@ class VectorDBTool(MCPToolWrapper):
                 "query": search_query,
                 "top_k": 5
             }
-        elif "create" in query.lower():
+        elif "create" in found:
             return {"action": "create"}
-        elif "delete" in query.lower():
+        elif "delete" in found:
             return {"action": "delete"}
         else:
             return {"action": "stats"}
@@ -169,13 +224,14 @@ class MongoDBTool(MCPToolWrapper):
 
     def _parse_query_to_args(self, query: str) -> Dict[str, Any]:
         """MongoDB 작업 파싱"""
-        if "find" in query.lower() or "search" in query.lower():
+        found = {m.lower() for m in _MONGODB_ACTION_PATTERN.findall(query)}
+        if "find" in found or "search" in found:
             return {
                 "action": "find",
                 "collection": "documents",
                 "limit": 10
             }
-        elif "insert" in query.lower():
+        elif "insert" in found:
             return {
                 "action": "insert",
                 "collection": "documents",
@@ -187,29 +243,35 @@ class MongoDBTool(MCPToolWrapper):
             }
 
 
-# Tool 팩토리 함수들
+@lru_cache(maxsize=1)
+def _get_mcp_config() -> MCPConfig:
+    """Tool 간 공유하는 MCP 설정 (최초 호출 시 1회 생성)"""
+    return MCPConfig()
+
+
+# Tool 팩토리 함수들 (Tool 인스턴스는 프로세스당 1개만 생성)
+@lru_cache(maxsize=1)
 def create_web_crawler_tool() -> WebCrawlerTool:
     """Web Crawler Tool 생성"""
-    config = MCPConfig()
-    return WebCrawlerTool(config)
+    return WebCrawlerTool(_get_mcp_config())
 
 
+@lru_cache(maxsize=1)
 def create_pdf_parser_tool() -> PDFParserTool:
     """PDF Parser Tool 생성"""
-    config = MCPConfig()
-    return PDFParserTool(config)
+    return PDFParserTool(_get_mcp_config())
 
 
+@lru_cache(maxsize=1)
 def create_vector_db_tool() -> VectorDBTool:
     """VectorDB Tool 생성"""
-    config = MCPConfig()
-    return VectorDBTool(config)
+    return VectorDBTool(_get_mcp_config())
 
 
+@lru_cache(maxsize=1)
 def create_mongodb_tool() -> MongoDBTool:
     """MongoDB Tool 생성"""
-    config = MCPConfig()
-    return MongoDBTool(config)
+    return MongoDBTool(_get_mcp_config())
 
 
 # 모든 MCP Tool 생성 함수
@@ -248,9 +310,7 @@ def register_mcp_tools_to_registry():
     registry = get_tool_registry()
     tools = get_all_mcp_tools()
 
-    for name, tool in tools.items():
-        registry.register_tool(name, type(tool), instantiate=False)
-        registry._tools[name] = tool  # 직접 인스턴스 등록
+    registry.register_bulk(tools)
 
     logger.info(f"📋 MCP Tools 등록 완료: {len(tools)}개")
 
@@ -3,12 +3,72 @@ RAG 관련 Tools
 벡터 검색, 문서 처리 등 RAG 전용 Tools
 """
 import logging
+import os
+from functools import lru_cache
+from pathlib import Path
 from typing import Any, Dict, Optional
 from langchain.tools import BaseTool
 from langchain.callbacks.manager import CallbackManagerForToolRun
 
 logger = logging.getLogger(__name__)
 
+# 컨텍스트 검색 더미 결과 (실제 구현 전까지 사용)
+_DUMMY_CONTEXTS = (
+    "반도체 제조 공정은 8개의 주요 단계로 구성됩니다.",
+    "Digital Twin은 물리적 시스템의 가상 복제본입니다.",
+    "Virtual Metrology는 측정 데이터를 예측하는 기술입니다.",
+)
+
+# 파일 경로로 취급할 확장자
+_PATH_SUFFIXES = frozenset({".txt", ".md", ".py", ".js", ".json", ".pdf"})
+
+# 파일 경로로 취급할 입력의 최대 길이 (Linux PATH_MAX)
+_MAX_PATH_LENGTH = 4096
+
+
+@lru_cache(maxsize=1)
+def _get_pdf_loader_class():
+    """PyPDFLoader 클래스 (langchain_community는 최초 사용 시 1회만 import)"""
+    from langchain_community.document_loaders import PyPDFLoader
+
+    return PyPDFLoader
+
+
+# 청크 크기 / 오버랩 (임베딩 모델 토큰 수 기준, 환경변수로 조정)
+_CHUNK_TOKENS = int(os.getenv("RAG_CHUNK_TOKENS", "256"))
+_CHUNK_OVERLAP_TOKENS = int(os.getenv("RAG_CHUNK_OVERLAP_TOKENS", "32"))
+
+_SPLITTER_SEPARATORS = ["\n\n", "\n", ". ", " ", ""]
+
+# 임베딩 모델명 -> 텍스트 스플리터
+_text_splitters: Dict[str, Any] = {}
+
+
+def _get_text_splitter(model_name: Optional[str] = None):
+    """
+    공용 텍스트 스플리터 (임베딩 모델별 1회 생성)
+    DocumentChunkerTool / PDFProcessorTool에서 공유
+    임베딩 모델 토크나이저로 청크 길이를 계산 (벡터 DB 인스턴스는 생성하지 않음)
+
+    Args:
+        model_name: 임베딩 모델명 (생략 시 벡터 DB 기본 모델)
+    """
+    from ..core.vector_db import DEFAULT_EMBEDDING_MODEL, _get_sentence_transformer
+
+    model_name = model_name or DEFAULT_EMBEDDING_MODEL
+    splitter = _text_splitters.get(model_name)
+    if splitter is None:
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+        splitter = RecursiveCharacterTextSplitter.from_huggingface_tokenizer(
+            _get_sentence_transformer(model_name).tokenizer,
+            chunk_size=_CHUNK_TOKENS,
+            chunk_overlap=_CHUNK_OVERLAP_TOKENS,
+            separators=_SPLITTER_SEPARATORS,
+        )
+        _text_splitters[model_name] = splitter
+    return splitter
+
 
 class VectorSearchTool(BaseTool):
     """
@@ -35,14 +95,13 @@ class VectorSearchTool(BaseTool):
             if not results:
                 return "검색 결과가 없습니다. VectorDB에 문서가 추가되지 않았을 수 있습니다."
 
-            result_text = f"벡터 검색 결과 ({len(results)}개):\n"
-            for i, result in enumerate(results, 1):
-                content = result.get('content', result.get('page_content', ''))[:150] + "..."
-                score = result.get('score', 'N/A')
-                source = result.get('metadata', {}).get('source', 'Unknown')
-                result_text += f"{i}. [{source}] {content} (유사도: {score})\n"
+            # similarity_search는 (Document, 점수) 튜플 리스트를 반환
+            lines = [
+                f"{i}. [{doc.metadata.get('source', 'Unknown')}] {doc.page_content[:150]}... (유사도: {score})"
+                for i, (doc, score) in enumerate(results, 1)
+            ]
 
-            return result_text
+            return f"벡터 검색 결과 ({len(results)}개):\n" + "\n".join(lines) + "\n"
 
         except Exception as e:
             logger.error(f"벡터 검색 실패: {e}")
@@ -72,20 +131,16 @@ class DocumentChunkerTool(BaseTool):
         try:
             logger.info("📄 문서 청킹 시작")
 
-            # LangChain RecursiveCharacterTextSplitter 사용
-            from langchain.text_splitter import RecursiveCharacterTextSplitter
-
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=1000,
-                chunk_overlap=200,
-                separators=["\n\n", "\n", ". ", " ", ""],
-                length_function=len,
-            )
-
             # 파일 경로인지 확인 후 읽기
+            # (경로 최대 길이를 넘거나 줄바꿈이 있으면 파일 경로가 아닌 본문으로 간주,
+            #  공백 없는 경로형 입력은 파일이 없어도 경로로 취급해 오류 반환)
             content = input_text
-            if input_text.endswith(('.txt', '.md', '.py', '.js', '.json', '.pdf')):
-                if input_text.endswith('.pdf'):
+            is_path_like = len(input_text) <= _MAX_PATH_LENGTH and "\n" not in input_text
+            ext = os.path.splitext(input_text)[1].lower() if is_path_like else ""
+            if ext in _PATH_SUFFIXES and (
+                os.path.isfile(input_text) or not any(ch.isspace() for ch in input_text)
+            ):
+                if ext == '.pdf':
                     # PDF는 별도 처리 필요
                     return "PDF 파일은 PDF Tool을 사용하세요."
                 try:
@@ -94,20 +149,24 @@ class DocumentChunkerTool(BaseTool):
                 except Exception as e:
                     return f"파일 읽기 실패: {e}"
 
+            # LangChain RecursiveCharacterTextSplitter 사용
+            text_splitter = _get_text_splitter()
             chunks = text_splitter.split_text(content)
 
-            result = f"LangChain 문서 청킹 완료: {len(chunks)}개 청크 생성\n"
-            result += f"- 원본 길이: {len(content):,} 문자\n"
-            result += f"- 청크 크기: 최대 1000자 (오버랩 200자)\n\n"
+            parts = [
+                f"LangChain 문서 청킹 완료: {len(chunks)}개 청크 생성\n",
+                f"- 원본 길이: {len(content):,} 문자\n",
+                f"- 청크 크기: 최대 {_CHUNK_TOKENS}토큰 (오버랩 {_CHUNK_OVERLAP_TOKENS}토큰)\n\n",
+            ]
 
             for i, chunk in enumerate(chunks[:3], 1):  # 처음 3개만 표시
                 preview = chunk[:100] + "..." if len(chunk) > 100 else chunk
-                result += f"청크 {i}: {preview}\n\n"
+                parts.append(f"청크 {i}: {preview}\n\n")
 
             if len(chunks) > 3:
-                result += f"... 외 {len(chunks) - 3}개 청크"
+                parts.append(f"... 외 {len(chunks) - 3}개 청크")
 
-            return result
+            return "".join(parts)
 
         except Exception as e:
             logger.error(f"문서 청킹 실패: {e}")
@@ -139,17 +198,10 @@ class ContextRetrieverTool(BaseTool):
             # TODO: 실제 컨텍스트 검색 구현
             # 벡터 검색 + 메모리 검색 등 통합
 
-            dummy_contexts = [
-                "반도체 제조 공정은 8개의 주요 단계로 구성됩니다.",
-                "Digital Twin은 물리적 시스템의 가상 복제본입니다.",
-                "Virtual Metrology는 측정 데이터를 예측하는 기술입니다."
-            ]
-
-            result = f"관련 컨텍스트 검색 결과:\n\n"
-            for i, context in enumerate(dummy_contexts, 1):
-                result += f"{i}. {context}\n"
+            parts = ["관련 컨텍스트 검색 결과:\n\n"]
+            parts.extend(f"{i}. {context}\n" for i, context in enumerate(_DUMMY_CONTEXTS, 1))
 
-            return result
+            return "".join(parts)
 
         except Exception as e:
             logger.error(f"컨텍스트 검색 실패: {e}")
@@ -178,11 +230,6 @@ class PDFProcessorTool(BaseTool):
         try:
             logger.info(f"📄 PDF 처리 시작: {file_path}")
 
-            # LangChain PDF 로더들
-            from langchain_community.document_loaders import PyPDFLoader
-            from langchain.text_splitter import RecursiveCharacterTextSplitter
-            from pathlib import Path
-
             # 파일 존재 확인
             pdf_path = Path(file_path)
             if not pdf_path.exists():
@@ -191,37 +238,41 @@ class PDFProcessorTool(BaseTool):
             if not pdf_path.suffix.lower() == '.pdf':
                 return "PDF 파일만 처리 가능합니다."
 
-            # PDF 로더 사용
-            loader = PyPDFLoader(str(pdf_path))
-            documents = loader.load()
+            # PDF 로더 사용 (페이지 단위로 읽으면서 바로 청킹, 전체 페이지를 메모리에 유지하지 않음)
+            loader = _get_pdf_loader_class()(str(pdf_path))
+            text_splitter = _get_text_splitter()
 
-            if not documents:
-                return "PDF에서 텍스트를 추출할 수 없습니다."
+            total_pages = 0
+            total_chars = 0
+            total_chunks = 0
+            first_chunk = None
+            for page in loader.lazy_load():
+                total_pages += 1
+                total_chars += len(page.page_content)
+
+                page_chunks = text_splitter.split_text(page.page_content)
+                total_chunks += len(page_chunks)
+                if first_chunk is None and page_chunks:
+                    first_chunk = page_chunks[0]
 
-            # 텍스트 청킹
-            text_splitter = RecursiveCharacterTextSplitter(
-                chunk_size=1000,
-                chunk_overlap=200,
-                separators=["\n\n", "\n", ". ", " ", ""]
-            )
-            chunks = text_splitter.split_documents(documents)
+            if total_pages == 0:
+                return "PDF에서 텍스트를 추출할 수 없습니다."
 
             # 결과 생성
-            total_pages = len(documents)
-            total_chunks = len(chunks)
-            total_chars = sum(len(doc.page_content) for doc in documents)
 
-            result = f"PDF 처리 완료: {pdf_path.name}\n"
-            result += f"- 총 페이지: {total_pages}페이지\n"
-            result += f"- 추출 텍스트: {total_chars:,} 문자\n"
-            result += f"- 생성 청크: {total_chunks}개\n\n"
+            parts = [
+                f"PDF 처리 완료: {pdf_path.name}\n",
+                f"- 총 페이지: {total_pages}페이지\n",
+                f"- 추출 텍스트: {total_chars:,} 문자\n",
+                f"- 생성 청크: {total_chunks}개\n\n",
+            ]
 
             # 샘플 청크
-            if chunks:
-                sample = chunks[0].page_content[:200] + "..." if len(chunks[0].page_content) > 200 else chunks[0].page_content
-                result += f"샘플 청크:\n{sample}\n"
+            if first_chunk is not None:
+                sample = first_chunk[:200] + "..." if len(first_chunk) > 200 else first_chunk
+                parts.append(f"샘플 청크:\n{sample}\n")
 
-            return result
+            return "".join(parts)
 
         except Exception as e:
             logger.error(f"PDF 처리 실패: {e}")
@@ -292,6 +343,11 @@ def create_context_retriever_tool() -> ContextRetrieverTool:
     return ContextRetrieverTool()
 
 
+def create_pdf_processor_tool() -> PDFProcessorTool:
+    """PDF 처리 Tool 생성"""
+    return PDFProcessorTool()
+
+
 def create_memory_access_tool() -> MemoryAccessTool:
     """메모리 접근 Tool 생성"""
     return MemoryAccessTool()
@@ -302,6 +358,7 @@ RAG_TOOL_FACTORIES = {
     "vector_search": create_vector_search_tool,
     "document_chunker": create_document_chunker_tool,
     "context_retriever": create_context_retriever_tool,
+    "pdf_processor": create_pdf_processor_tool,
     "memory_access": create_memory_access_tool
 }
 
@@ -333,9 +390,7 @@ def register_rag_tools_to_registry():
     registry = get_tool_registry()
     tools = get_all_rag_tools()
 
-    for name, tool in tools.items():
-        registry.register_tool(name, type(tool), instantiate=False)
-        registry._tools[name] = tool  # 직접 인스턴스 등록
+    registry.register_bulk(tools)
 
     logger.info(f"📋 RAG Tools 등록 완료: {len(tools)}개")
 
@@ -3,6 +3,8 @@ Tool Registry
 LangChain Tools 등록 및 관리
 """
 import logging
+import threading
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Type
 from functools import lru_cache
 
@@ -11,6 +13,14 @@ from langchain.tools import BaseTool
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class _ToolEntry:
+    """등록된 Tool 정보 (클래스, 초기화 파라미터, 생성된 인스턴스)"""
+    tool_class: Type[BaseTool]
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    instance: Optional[BaseTool] = None
+
+
 class ToolRegistry:
     """
     Tool 등록 및 관리 시스템
@@ -18,8 +28,7 @@ class ToolRegistry:
     """
 
     def __init__(self):
-        self._tools: Dict[str, BaseTool] = {}
-        self._tool_classes: Dict[str, Type[BaseTool]] = {}
+        self._entries: Dict[str, _ToolEntry] = {}
         self.logger = logger
 
         logger.info("🔧 Tool Registry 초기화")
@@ -32,20 +41,40 @@ class ToolRegistry:
             name: Tool 이름
             tool_class: Tool 클래스
             **kwargs: Tool 초기화 파라미터
+                (instantiate=True 지정 시 즉시 인스턴스화, 기본은 최초 get_tool 호출 시 생성)
+
+        Note:
+            기본(지연 생성)에서는 Tool 생성 실패가 등록 시점이 아닌 최초 get_tool 호출 시점에
+            로그로 남고, 해당 get_tool은 None을 반환함. 등록 시점에 실패를 확인하려면
+            instantiate=True 사용
         """
         try:
-            self._tool_classes[name] = tool_class
+            instantiate = kwargs.pop('instantiate', False)
+            entry = _ToolEntry(tool_class, kwargs)
 
-            # 즉시 인스턴스화 (필요시)
-            if kwargs.get('instantiate', True):
-                tool_instance = tool_class(**kwargs)
-                self._tools[name] = tool_instance
+            # 즉시 인스턴스화 (요청 시에만)
+            if instantiate:
+                entry.instance = tool_class(**kwargs)
 
+            self._entries[name] = entry
             logger.info(f"✅ Tool 등록: {name}")
 
         except Exception as e:
             logger.error(f"❌ Tool 등록 실패 ({name}): {e}")
 
+    def register_bulk(self, tools: Dict[str, BaseTool]) -> None:
+        """
+        생성된 Tool 인스턴스 일괄 등록
+
+        Args:
+            tools: Tool 이름 -> Tool 인스턴스 매핑
+        """
+        self._entries.update(
+            (name, _ToolEntry(type(tool), instance=tool)) for name, tool in tools.items()
+        )
+
+        logger.info(f"✅ Tool 일괄 등록: {len(tools)}개")
+
     def get_tool(self, name: str) -> Optional[BaseTool]:
         """
         Tool 인스턴스 가져오기
@@ -56,31 +85,31 @@ class ToolRegistry:
         Returns:
             Tool 인스턴스 또는 None
         """
-        # 이미 인스턴스화된 경우 반환
-        if name in self._tools:
-            return self._tools[name]
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        return self._instantiate(name, entry)
 
-        # 클래스에서 인스턴스화
-        if name in self._tool_classes:
+    def _instantiate(self, name: str, entry: _ToolEntry) -> Optional[BaseTool]:
+        """엔트리의 Tool 인스턴스 반환 (아직 인스턴스화되지 않은 경우 클래스에서 생성)"""
+        if entry.instance is None:
             try:
-                tool_instance = self._tool_classes[name]()
-                self._tools[name] = tool_instance
-                return tool_instance
+                entry.instance = entry.tool_class(**entry.kwargs)
             except Exception as e:
                 logger.error(f"Tool 인스턴스화 실패 ({name}): {e}")
 
-        return None
+        return entry.instance
 
     def get_all_tools(self) -> List[BaseTool]:
         """
-        모든 Tool 인스턴스 목록
+        모든 Tool 인스턴스 목록 (엔트리를 한 번만 순회하며 필요한 경우에만 인스턴스화)
 
         Returns:
             Tool 인스턴스 리스트
         """
         tools = []
-        for name in self._tool_classes.keys():
-            tool = self.get_tool(name)
+        for name, entry in self._entries.items():
+            tool = self._instantiate(name, entry)
             if tool:
                 tools.append(tool)
         return tools
@@ -92,7 +121,7 @@ class ToolRegistry:
         Returns:
             Tool 이름 리스트
         """
-        return list(self._tool_classes.keys())
+        return list(self._entries)
 
     def has_tool(self, name: str) -> bool:
         """
@@ -104,7 +133,7 @@ class ToolRegistry:
         Returns:
             존재 여부
         """
-        return name in self._tool_classes
+        return name in self._entries
 
     def remove_tool(self, name: str) -> bool:
         """
@@ -116,25 +145,15 @@ class ToolRegistry:
         Returns:
             제거 성공 여부
         """
-        try:
-            if name in self._tools:
-                del self._tools[name]
-            if name in self._tool_classes:
-                del self._tool_classes[name]
-
-            logger.info(f"🗑️ Tool 제거: {name}")
-            return True
-
-        except Exception as e:
-            logger.error(f"Tool 제거 실패 ({name}): {e}")
-            return False
+        self._entries.pop(name, None)
+        logger.info(f"🗑️ Tool 제거: {name}")
+        return True
 
     def clear_all_tools(self) -> None:
         """
         모든 Tool 클리어
         """
-        self._tools.clear()
-        self._tool_classes.clear()
+        self._entries.clear()
         logger.info("🧹 모든 Tool 클리어됨")
 
     def get_registry_stats(self) -> Dict[str, Any]:
@@ -145,14 +164,15 @@ class ToolRegistry:
             통계 정보
         """
         return {
-            "total_tools": len(self._tool_classes),
-            "instantiated_tools": len(self._tools),
+            "total_tools": len(self._entries),
+            "instantiated_tools": sum(1 for entry in self._entries.values() if entry.instance is not None),
             "tool_names": self.get_tool_names()
         }
 
 
 # 싱글톤 패턴
 _registry_instance = None
+_registry_lock = threading.Lock()
 
 
 def get_tool_registry() -> ToolRegistry:
@@ -164,7 +184,9 @@ def get_tool_registry() -> ToolRegistry:
     """
     global _registry_instance
     if _registry_instance is None:
-        _registry_instance = ToolRegistry()
+        with _registry_lock:
+            if _registry_instance is None:
+                _registry_instance = ToolRegistry()
     return _registry_instance
 
 
@@ -0,0 +1,63 @@
+"""
+PDF Parser MCP Tool 청킹 로직 테스트
+"""
+import unittest
+
+from app.mcp.tools.pdf_tool import _chunk_text
+
+
+def _words(n: int) -> str:
+    """w0 w1 ... w{n-1} 형태의 테스트 텍스트"""
+    return " ".join(f"w{i}" for i in range(n))
+
+
+class ChunkTextTest(unittest.TestCase):
+    """_chunk_text 슬라이딩 윈도우 청킹"""
+
+    def test_empty_text(self):
+        self.assertEqual(_chunk_text("", 4, 1), [])
+        self.assertEqual(_chunk_text("  \n ", 4, 1), [])
+
+    def test_fewer_words_than_chunk_size(self):
+        # N < K: 전체 텍스트가 하나의 청크
+        self.assertEqual(_chunk_text(_words(3), 5, 2), [_words(3)])
+
+    def test_words_equal_chunk_size(self):
+        # N == K: 하나의 청크만 생성 (끝 단어만 겹치는 중복 청크 없음)
+        self.assertEqual(_chunk_text(_words(4), 4, 1), [_words(4)])
+
+    def test_words_not_multiple_of_stride(self):
+        # N=10, K=4, S=3: 시작 위치 0, 3, 6
+        chunks = _chunk_text(_words(10), 4, 1)
+        self.assertEqual(chunks, [
+            "w0 w1 w2 w3",
+            "w3 w4 w5 w6",
+            "w6 w7 w8 w9",
+        ])
+
+    def test_last_window_reaches_last_word(self):
+        for n in range(1, 30):
+            for chunk_size, overlap in ((4, 1), (5, 2), (3, 0), (7, 6)):
+                with self.subTest(n=n, chunk_size=chunk_size, overlap=overlap):
+                    chunks = _chunk_text(_words(n), chunk_size, overlap)
+                    self.assertTrue(chunks[-1].endswith(f"w{n - 1}"))
+                    # 마지막 직전 청크는 끝 단어에 도달하지 않음 (불필요한 청크 없음)
+                    if len(chunks) > 1:
+                        self.assertNotIn(f"w{n - 1}", chunks[-2].split())
+
+    def test_preserves_original_whitespace(self):
+        self.assertEqual(_chunk_text("a\n\nb  c d", 3, 1), ["a\n\nb  c", "c d"])
+
+    def test_invalid_overlap_raises(self):
+        with self.assertRaises(ValueError):
+            _chunk_text(_words(10), 4, 4)
+        with self.assertRaises(ValueError):
+            _chunk_text(_words(10), 4, 5)
+
+    def test_invalid_chunk_size_raises(self):
+        with self.assertRaises(ValueError):
+            _chunk_text(_words(10), 0, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
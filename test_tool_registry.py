@@ -0,0 +1,78 @@
+"""
+Tool Registry 테스트
+"""
+import unittest
+
+from app.tools.registry import ToolRegistry
+
+
+class _RecordingTool:
+    """생성 인자를 기록하는 테스트용 Tool 클래스"""
+
+    created = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        _RecordingTool.created.append(kwargs)
+
+
+class _FailingTool:
+    """생성 시 예외를 발생시키는 테스트용 Tool 클래스"""
+
+    def __init__(self, **kwargs):
+        raise RuntimeError("boom")
+
+
+class ToolRegistryTest(unittest.TestCase):
+    """ToolRegistry 등록 / 지연 생성"""
+
+    def setUp(self):
+        _RecordingTool.created = []
+        self.registry = ToolRegistry()
+
+    def test_register_is_lazy(self):
+        self.registry.register_tool("recording", _RecordingTool, x=1)
+
+        self.assertEqual(_RecordingTool.created, [])
+        self.assertTrue(self.registry.has_tool("recording"))
+        self.assertEqual(self.registry.get_registry_stats()["instantiated_tools"], 0)
+
+    def test_first_get_tool_constructs_with_registered_kwargs(self):
+        self.registry.register_tool("recording", _RecordingTool, x=1)
+
+        tool = self.registry.get_tool("recording")
+
+        self.assertIsInstance(tool, _RecordingTool)
+        self.assertEqual(tool.kwargs, {"x": 1})
+        self.assertNotIn("instantiate", tool.kwargs)
+        # 이후 호출은 같은 인스턴스 재사용
+        self.assertIs(self.registry.get_tool("recording"), tool)
+        self.assertEqual(len(_RecordingTool.created), 1)
+
+    def test_instantiate_true_constructs_eagerly(self):
+        self.registry.register_tool("recording", _RecordingTool, x=1, instantiate=True)
+
+        self.assertEqual(_RecordingTool.created, [{"x": 1}])
+        self.assertEqual(self.registry.get_registry_stats()["instantiated_tools"], 1)
+        self.assertIs(self.registry.get_tool("recording").kwargs, _RecordingTool.created[0])
+
+    def test_lazy_construction_failure_surfaces_on_get_tool(self):
+        self.registry.register_tool("failing", _FailingTool)
+        self.assertTrue(self.registry.has_tool("failing"))
+
+        with self.assertLogs("app.tools.registry", level="ERROR"):
+            self.assertIsNone(self.registry.get_tool("failing"))
+
+    def test_get_all_tools_instantiates_lazy_entries(self):
+        self.registry.register_tool("recording", _RecordingTool, x=1)
+        self.registry.register_tool("failing", _FailingTool)
+
+        with self.assertLogs("app.tools.registry", level="ERROR"):
+            tools = self.registry.get_all_tools()
+
+        self.assertEqual(len(tools), 1)
+        self.assertIsInstance(tools[0], _RecordingTool)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+"""
+SentenceTransformerEmbeddings 래퍼 테스트
+"""
+import unittest
+
+import numpy as np
+
+from app.core.vector_db import SentenceTransformerEmbeddings
+
+
+class _FakeModel:
+    """입력 텍스트 길이로 2차원 임베딩을 만드는 테스트용 모델"""
+
+    def encode(self, texts, **kwargs):
+        if isinstance(texts, str):
+            return np.array([len(texts), 1.0], dtype=np.float32)
+        return np.array([[len(text), 1.0] for text in texts], dtype=np.float32)
+
+
+class SentenceTransformerEmbeddingsTest(unittest.TestCase):
+    """FAISS embedding_function 호출 규약"""
+
+    def setUp(self):
+        self.embeddings = SentenceTransformerEmbeddings(_FakeModel())
+
+    def test_call_with_single_string_returns_one_vector(self):
+        vector = self.embeddings("hello")
+
+        self.assertEqual(len(vector), 2)
+        self.assertEqual(vector, self.embeddings.embed_query("hello"))
+
+    def test_call_with_list_returns_one_vector_per_text(self):
+        vectors = self.embeddings(["aa", "b", "aa"])
+
+        self.assertEqual(len(vectors), 3)
+        self.assertEqual(vectors[0], vectors[2])
+        self.assertEqual([len(v) for v in vectors], [2, 2, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()